@@ -1,44 +1,147 @@
 # examples/plugins/display_plugin/display_plugin.py
 import logging
+import weakref
+from functools import lru_cache
+from typing import Dict
 
-from PySide6.QtCore import Slot, Qt
-from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout
+from PySide6.QtCore import Slot, Qt, QTimer, QLocale
+from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout
 
 from just_gui import BasePlugin
 
 logger = logging.getLogger(__name__)
 
+_NO_VALUE = object()
+
+# QLabel.setNum(int) takes a C int; larger ints and all floats are shown with str() like an f-string would
+_C_INT_MIN, _C_INT_MAX = -2 ** 31, 2 ** 31 - 1
+
+# UI strings of the DisplayWidget per UI language; English is the fallback
+_TEXTS: Dict[QLocale.Language, Dict[str, str]] = {
+    QLocale.Language.English: {
+        "prefix": "Current value:",
+        "waiting": "Waiting for counter value...",
+        "not_initialized": "Counter not initialized",
+        "unknown": "Unknown value: {}",
+    },
+    QLocale.Language.Russian: {
+        "prefix": "Текущее значение:",
+        "waiting": "Ожидание значения счетчика...",
+        "not_initialized": "Счетчик не инициализирован",
+        "unknown": "Неизвестное значение: {}",
+    },
+}
+
+
+@lru_cache(maxsize=1)
+def _system_texts() -> Dict[str, str]:
+    """Returns the UI strings for the system UI language, resolved once per process."""
+    return _TEXTS.get(QLocale.system().language(), _TEXTS[QLocale.Language.English])
+
 
 class DisplayWidget(QWidget):
     """A widget that displays the counter value from the state."""
 
+    UPDATE_INTERVAL_MS = 16  # ~60 Hz, faster updates are not perceivable anyway
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.display_label = QLabel("Waiting for counter value...")
-        font = self.display_label.font()
+        self._texts = _system_texts()
+        # The static prefix lives in its own label, so numeric updates only touch value_label via setNum()
+        self.prefix_label = QLabel(self._texts["prefix"])
+        self.value_label = QLabel(self._texts["waiting"])
+        font = self.value_label.font()
         font.setPointSize(24)
-        self.display_label.setFont(font)
-        self.display_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.prefix_label.setFont(font)
+        self.value_label.setFont(font)
+        self.prefix_label.hide()
+        self._prefix_visible = False
+
+        value_layout = QHBoxLayout()
+        value_layout.addWidget(self.prefix_label)
+        value_layout.addWidget(self.value_label)
 
         layout = QVBoxLayout(self)
         layout.addStretch(1)
-        layout.addWidget(self.display_label, alignment=Qt.AlignmentFlag.AlignCenter)
+        layout.addLayout(value_layout)
+        layout.setAlignment(value_layout, Qt.AlignmentFlag.AlignCenter)
         layout.addStretch(1)
         self.setLayout(layout)
 
         self.setMinimumSize(200, 100)
 
+        self._last_value = _NO_VALUE
+
+        # Leading + trailing throttle: the first change is shown immediately,
+        # changes arriving within the interval are collapsed into the last one.
+        self._pending_value = None
+        self._has_pending_value = False
+        self._throttle_timer = QTimer(self)
+        self._throttle_timer.setSingleShot(True)
+        self._throttle_timer.setInterval(self.UPDATE_INTERVAL_MS)
+        self._throttle_timer.timeout.connect(self._flush_pending_value)
+
+    def on_state_changed(self, value):
+        """Throttled entry point for state notifications."""
+        if self._throttle_timer.isActive():
+            self._pending_value = value
+            self._has_pending_value = True
+            return
+        self.update_value(value)
+        self._throttle_timer.start()
+
+    @Slot()
+    def _flush_pending_value(self):
+        """Shows the last value received while the throttle timer was running."""
+        if not self._has_pending_value:
+            return
+        value = self._pending_value
+        self._pending_value = None
+        self._has_pending_value = False
+        self.update_value(value)
+        self._throttle_timer.start()
+
     @Slot(object)
     def update_value(self, value):
         """Updates the displayed value."""
-        logger.debug(f"DisplayWidget: Received new value {value} from state.")
-        if value is None:
-            self.display_label.setText("Counter not initialized")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DisplayWidget: Received new value %r from state.", value)
+        if type(value) is type(self._last_value) and value == self._last_value:
+            return
+        if type(value) is int:
+            self.update_value_int(value)
+        elif value is None:
+            self.update_value_none()
         else:
+            self._last_value = value
             if isinstance(value, (int, float)):
-                self.display_label.setText(f"Current value: {value}")
+                self._set_prefix_visible(True)
+                self.value_label.setText(str(value))
             else:
-                self.display_label.setText(f"Unknown value: {value}")
+                self._set_prefix_visible(False)
+                self.value_label.setText(self._texts["unknown"].format(value))
+
+    @Slot(int)
+    def update_value_int(self, value: int):
+        """Fast path for integer values (the usual counter case)."""
+        self._last_value = value
+        self._set_prefix_visible(True)
+        if _C_INT_MIN <= value <= _C_INT_MAX:
+            self.value_label.setNum(value)
+        else:
+            self.value_label.setText(str(value))
+
+    @Slot()
+    def update_value_none(self):
+        """Shows that the counter has no value yet."""
+        self._last_value = None
+        self._set_prefix_visible(False)
+        self.value_label.setText(self._texts["not_initialized"])
+
+    def _set_prefix_visible(self, visible: bool):
+        if visible != self._prefix_visible:
+            self._prefix_visible = visible
+            self.prefix_label.setVisible(visible)
 
 
 class DisplayPlugin(BasePlugin):
@@ -65,14 +168,8 @@ class DisplayPlugin(BasePlugin):
 
         widget = DisplayWidget()
 
-        self._state.subscribe(self.COUNTER_STATE_KEY, widget.update_value)
+        self._state.subscribe(self.COUNTER_STATE_KEY, weakref.WeakMethod(widget.on_state_changed), initial=True)
         logger.debug(f"DisplayWidget subscribed to state '{self.COUNTER_STATE_KEY}'")
-
-        widget.setProperty("unsubscribe_callback",
-                           lambda: self._state.unsubscribe(self.COUNTER_STATE_KEY, widget.update_value))
-
-        initial_value = self._state.get(self.COUNTER_STATE_KEY)
-        widget.update_value(initial_value)
         logger.debug(f"Plugin '{self.name}': DisplayWidget created and configured.")
 
         return widget
@@ -1,6 +1,8 @@
 # examples/plugins/event_listener/listener.py
 import logging
-from typing import Dict, Any
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any
 
 from PySide6.QtCore import Slot
 from PySide6.QtGui import QAction, QIcon
@@ -10,6 +12,12 @@ from just_gui import BasePlugin
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _log_icon() -> QIcon:
+    """Returns the 'Log Counter' icon, looking it up in the icon theme only once."""
+    return QIcon.fromTheme("document-print-preview")
+
+
 class ListenerPlugin(BasePlugin):
     """A plugin that listens to counter events and displays them in the status bar,
        and also allows logging the current value via a button."""
@@ -24,7 +32,7 @@ class ListenerPlugin(BasePlugin):
         self._bus.subscribe(self.COUNTER_EVENT_PATTERN, self._handle_counter_event)
         logger.debug(f"Plugin '{self.name}': Subscribed to events '{self.COUNTER_EVENT_PATTERN}'")
 
-        log_action = QAction(QIcon.fromTheme("document-print-preview"), "Log Counter", self._app)
+        log_action = QAction(_log_icon(), "Log Counter", self._app)
         log_action.setStatusTip("Output the current counter value to the log")
         log_action.triggered.connect(self._log_current_count)
         self.register_toolbar_widget(log_action, section="Info")
@@ -41,12 +49,16 @@ class ListenerPlugin(BasePlugin):
             logger.warning(f"Plugin '{self.name}': Error unsubscribing from events: {e}")
         logger.info(f"Plugin '{self.name}': Unloaded.")
 
-    async def _handle_counter_event(self, event_data: Dict[str, Any]):
-        """Asynchronous handler for counter events."""
-        value = event_data.get('value', 'N/A')
-        message = f"Event: Counter changed to {value}"
-        logger.debug(f"Plugin '{self.name}': Received event: {event_data}. Status: '{message}'")
-        self.update_status(message, timeout=5000)
+    async def _handle_counter_event(self, event_data: Any):
+        """Asynchronous handler for counter events (payload is a dict or an object with a 'value' key/attribute)."""
+        if isinstance(event_data, Mapping):
+            value = event_data.get('value', 'N/A')
+        else:
+            value = getattr(event_data, 'value', 'N/A')
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Plugin '%s': Received event: %s", self.name, event_data)
+        # UIManager.update_status() already coalesces bursts into one status bar repaint
+        self.update_status(f"Event: Counter changed to {value}", timeout=5000)
 
     @Slot()
     def _log_current_count(self):
@@ -1,10 +1,11 @@
 # examples/plugins/simple_counter/simple_counter.py
 import logging
-from typing import Optional
-import asyncio
+import weakref
+from dataclasses import dataclass
+from typing import Any, Mapping
 
 from PySide6.QtWidgets import QWidget, QPushButton, QLabel, QVBoxLayout, QHBoxLayout
-from PySide6.QtCore import Slot, Signal
+from PySide6.QtCore import Slot, Signal, Qt
 from PySide6.QtGui import QAction
 
 from just_gui import BasePlugin, PluginContext
@@ -12,133 +13,172 @@ from just_gui.security.decorators import require_permission
 
 logger = logging.getLogger(__name__)
 
+# Range accepted by QLabel.setNum(int)
+_C_INT_MIN, _C_INT_MAX = -2 ** 31, 2 ** 31 - 1
+
+
+@dataclass(frozen=True)
+class CounterChanged:
+    """Payload of the counter change event."""
+    __slots__ = ("value", "change")
+    value: int
+    change: str
+
+
+@dataclass(frozen=True)
+class CounterConfig:
+    """Counter settings from the profile's [plugin_configs.simple_counter] section."""
+    __slots__ = ("initial_value", "step")
+    initial_value: int
+    step: int
+
+    @classmethod
+    def from_mapping(cls, config: Mapping[str, Any]) -> 'CounterConfig':
+        return cls(initial_value=config.get("initial_value", 0), step=config.get("step", 1))
+
 
 class CounterWidget(QWidget):
     valueChanged = Signal(int)
 
-    def __init__(self, initial_value=0, step=1, parent=None):
+    def __init__(self, initial_value=0, parent=None):
         super().__init__(parent)
         self.current_value = initial_value
-        self.step = step
-        self.label = QLabel(f"Value: {self.current_value}")
+        self.prefix_label = QLabel("Value:")
+        self.value_label = QLabel()
+        self._show_value(self.current_value)
         self.inc_button = QPushButton("+")
         self.dec_button = QPushButton("-")
         layout = QVBoxLayout(self)
+        label_layout = QHBoxLayout()
+        label_layout.addWidget(self.prefix_label)
+        label_layout.addWidget(self.value_label, 1)
         h_layout = QHBoxLayout()
         h_layout.addWidget(self.dec_button)
         h_layout.addWidget(self.inc_button)
-        layout.addWidget(self.label)
+        layout.addLayout(label_layout)
         layout.addLayout(h_layout)
 
     @Slot(int)
-    def update_display(self, value: int): self.current_value = value; self.label.setText(
-        f"Value: {self.current_value}"); self.valueChanged.emit(value)
+    def update_display(self, value: int):
+        if value == self.current_value: return
+        self.current_value = value
+        self._show_value(value)
+        self.valueChanged.emit(value)
+
+    def _show_value(self, value):
+        """Shows the value as the old f-string did; setNum() is only a shortcut for C-int-sized ints."""
+        if type(value) is int and _C_INT_MIN <= value <= _C_INT_MAX:
+            self.value_label.setNum(value)
+        else:
+            self.value_label.setText(str(value))
 
     def get_value(self) -> int: return self.current_value
 
-    def increment(self): return self.current_value + self.step
-
-    def decrement(self): return self.current_value - self.step
-
 
 class CounterPlugin(BasePlugin):
     COUNTER_STATE_KEY = "counter.value"
+    COUNTER_EVENT_TOPIC = "counter.changed"
 
     def __init__(self, context: PluginContext):
         super().__init__(context)
-        self.widget_instance: Optional[CounterWidget] = None
         self.initial_value = 0
         self.step = 1
+        self._big_step = 10
+        self._big_step_label = "Increase by 10"
+        # Bound once; used by the click slots
+        self._state_get = self._state.get
+        self._state_apply = self._state.apply
 
     def on_load(self):
-        logger.info(f"Plugin '{self.name}': Loading...")
-        config = self.get_config("simple_counter", {})
-        self.initial_value = config.get("initial_value", 0)
-        self.step = config.get("step", 1)
-
-        self.declare_view(
-            view_id="counter_widget",
-            name="Counter",
-            factory=self._create_counter_widget
-        )
-
-        action_inc_10 = QAction(f"Increase by {self.step * 10}", self._app)
-        action_inc_10.triggered.connect(self.increment_by_10)
-        self.register_menu_action(f"Tools/{self.name}", action_inc_10)
-
-        action_reset = QAction("Reset Counter", self._app)
-        action_reset.triggered.connect(self.reset_counter)
-        self.register_menu_action(f"Tools/{self.name}", action_reset)
+        logger.info("Plugin '%s': Loading...", self.name)
+        # The plugin config already is the [plugin_configs.simple_counter] section
+        config = CounterConfig.from_mapping(self._config)
+        self.initial_value = config.initial_value
+        self.step = config.step
+        self._big_step = self.step * 10
+        self._big_step_label = f"Increase by {self._big_step}"
+        menu_path = f"Tools/{self.name}"
+
+        with self.bulk_register():
+            self.declare_view(
+                view_id="counter_widget",
+                name="Counter",
+                factory=self._create_counter_widget
+            )
+
+            action_inc_10 = QAction(self._big_step_label, self._app)
+            action_inc_10.triggered.connect(self.increment_by_10)
+            self.register_menu_action(menu_path, action_inc_10)
+
+            action_reset = QAction("Reset Counter", self._app)
+            action_reset.triggered.connect(self.reset_counter)
+            self.register_menu_action(menu_path, action_reset)
 
         current_state_value = self._state.get(self.COUNTER_STATE_KEY)
         if current_state_value is None:
-            logger.debug(f"Initializing state '{self.COUNTER_STATE_KEY}' with value {self.initial_value}")
+            logger.debug("Initializing state '%s' with value %s", self.COUNTER_STATE_KEY, self.initial_value)
             self._state.set(self.COUNTER_STATE_KEY, self.initial_value, description="Initial counter value")
         else:
             self.initial_value = current_state_value
-            logger.debug(f"State '{self.COUNTER_STATE_KEY}' already contains value: {self.initial_value}")
+            logger.debug("State '%s' already contains value: %s", self.COUNTER_STATE_KEY, self.initial_value)
 
-        logger.info(f"Plugin '{self.name}': Loaded.")
+        logger.info("Plugin '%s': Loaded.", self.name)
 
     def _create_counter_widget(self) -> CounterWidget:
-        logger.debug(f"Plugin '{self.name}': Creating CounterWidget instance...")
+        logger.debug("Plugin '%s': Creating CounterWidget instance...", self.name)
         current_value = self._state.get(self.COUNTER_STATE_KEY, self.initial_value)
-        widget = CounterWidget(initial_value=current_value, step=self.step)
-        self.widget_instance = widget
+        widget = CounterWidget(initial_value=current_value)
 
-        widget.inc_button.clicked.connect(self.increment_value)
-        widget.dec_button.clicked.connect(self.decrement_value)
+        # Buttons live in the GUI thread, so the slots can be invoked directly
+        widget.inc_button.clicked.connect(self.increment_value, Qt.ConnectionType.DirectConnection)
+        widget.dec_button.clicked.connect(self.decrement_value, Qt.ConnectionType.DirectConnection)
 
-        self._state.subscribe(self.COUNTER_STATE_KEY, widget.update_display)
-        logger.debug(f"CounterWidget subscribed to state '{self.COUNTER_STATE_KEY}'")
-        widget.setProperty("unsubscribe_callback",
-                           lambda: self._state.unsubscribe(self.COUNTER_STATE_KEY, widget.update_display))
+        self._state.subscribe(self.COUNTER_STATE_KEY, weakref.WeakMethod(widget.update_display), coalesce=True)
+        logger.debug("CounterWidget subscribed to state '%s'", self.COUNTER_STATE_KEY)
 
         return widget
 
-    @Slot()
+    @Slot(bool)
     @require_permission("state", "write")
-    def increment_value(self):
-        if self.widget_instance:
-            new_value = self.widget_instance.increment()
-            logger.debug(f"Increment: new value = {new_value}")
-            with self._state.history.group("Increment counter"):
-                self._state.set(self.COUNTER_STATE_KEY, new_value)
-                asyncio.create_task(self._bus.publish("counter.changed", {"value": new_value, "change": "increment"}))
-        else:
-            logger.warning("Attempted increment, but widget not created.")
-
-    @Slot()
+    def increment_value(self, checked: bool = False):
+        # The widget display may lag behind the state (coalesced updates), so use the state value
+        new_value = self._state_get(self.COUNTER_STATE_KEY, self.initial_value) + self.step
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Increment: new value = %s", new_value)
+        self._state_apply(self.COUNTER_STATE_KEY, new_value, description="Increment counter",
+                          publish_topic=self.COUNTER_EVENT_TOPIC,
+                          publish_payload=CounterChanged(new_value, "increment"))
+
+    @Slot(bool)
     @require_permission("state", "write")
-    def decrement_value(self):
-        if self.widget_instance:
-            new_value = self.widget_instance.decrement()
-            logger.debug(f"Decrement: new value = {new_value}")
-            with self._state.history.group("Decrement counter"):
-                self._state.set(self.COUNTER_STATE_KEY, new_value)
-                asyncio.create_task(self._bus.publish("counter.changed", {"value": new_value, "change": "decrement"}))
-        else:
-            logger.warning("Attempted decrement, but widget not created.")
+    def decrement_value(self, checked: bool = False):
+        # The widget display may lag behind the state (coalesced updates), so use the state value
+        new_value = self._state_get(self.COUNTER_STATE_KEY, self.initial_value) - self.step
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Decrement: new value = %s", new_value)
+        self._state_apply(self.COUNTER_STATE_KEY, new_value, description="Decrement counter",
+                          publish_topic=self.COUNTER_EVENT_TOPIC,
+                          publish_payload=CounterChanged(new_value, "decrement"))
 
     @Slot()
     def increment_by_10(self):
         """Increases the counter by 10 * step."""
-        current_value = self._state.get(self.COUNTER_STATE_KEY, self.initial_value)
-        new_value = current_value + (self.step * 10)
-        logger.debug(f"Increment by {self.step * 10}: new value = {new_value}")
-        with self._state.history.group(f"Increase by {self.step * 10}"):
-            self._state.set(self.COUNTER_STATE_KEY, new_value)
-            asyncio.create_task(self._bus.publish("counter.changed", {"value": new_value, "change": "increment_10"}))
+        current_value = self._state_get(self.COUNTER_STATE_KEY, self.initial_value)
+        new_value = current_value + self._big_step
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Increment by %s: new value = %s", self._big_step, new_value)
+        self._state_apply(self.COUNTER_STATE_KEY, new_value, description=self._big_step_label,
+                          publish_topic=self.COUNTER_EVENT_TOPIC,
+                          publish_payload=CounterChanged(new_value, "increment_10"))
 
     @Slot()
     def reset_counter(self):
         """Drops the counter to the initial value."""
-        logger.debug(f"Resetting counter to {self.initial_value}")
-        with self._state.history.group("Reset counter"):
-            self._state.set(self.COUNTER_STATE_KEY, self.initial_value)
-            asyncio.create_task(self._bus.publish("counter.changed", {"value": self.initial_value, "change": "reset"}))
+        logger.debug("Resetting counter to %s", self.initial_value)
+        self._state_apply(self.COUNTER_STATE_KEY, self.initial_value, description="Reset counter",
+                          publish_topic=self.COUNTER_EVENT_TOPIC,
+                          publish_payload=CounterChanged(self.initial_value, "reset"))
 
     def on_unload(self):
-        logger.info(f"Plugin '{self.name}': Unloading...")
-        self.widget_instance = None
-        logger.info(f"Plugin '{self.name}': Unloaded.")
+        logger.info("Plugin '%s': Unloading...", self.name)
+        logger.info("Plugin '%s': Unloaded.", self.name)
@@ -3,6 +3,9 @@
 Основной пакет библиотеки just-gui.
 """
 
+# Объявлена до импортов: модули пакета читают версию при собственном импорте
+__version__ = "0.1.1-beta"
+
 # Экспорт ключевых классов для удобства использования
 from .core.app import AppCore
 from .plugins.base import BasePlugin, PluginContext
@@ -10,8 +13,6 @@ from .state.manager import StateManager
 from .events.bus import EventBus
 from .security.decorators import require_permission  # Пока заглушка
 
-__version__ = "0.1.1-beta"
-
 __all__ = [
     "AppCore",
     "BasePlugin",
@@ -1,12 +1,14 @@
 # src/just_gui/core/app.py
+import asyncio
 import logging
-import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property, lru_cache, partial
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, Optional, TYPE_CHECKING
 
-import platformdirs
-from PySide6.QtGui import QAction
-from PySide6.QtWidgets import QMainWindow, QMessageBox, QWidget
+from PySide6.QtCore import Qt, QThreadPool, QTimer
+from PySide6.QtWidgets import QApplication, QMainWindow, QMessageBox
 
 from .theme_manager import apply_theme
 from .ui_manager import UIManager
@@ -17,11 +19,36 @@ from ..plugins.manager import PluginManager
 from ..state.manager import StateManager
 from ..utils.config_loader import load_toml, ConfigError
 
+if TYPE_CHECKING:
+    from PySide6.QtGui import QAction
+    from PySide6.QtWidgets import QWidget
+
 APP_NAME = "just-gui"
 APP_AUTHOR = "dimnissv"
 
 logger = logging.getLogger(__name__)
 
+# How long closing the application waits for background writes (e.g. the view state)
+_SHUTDOWN_WRITE_TIMEOUT_MS = 500
+
+# Window types Qt counts when deciding whether the last window was closed (popups, tool tips etc. are ignored)
+_QUIT_RELEVANT_WINDOW_TYPES = (Qt.WindowType.Window, Qt.WindowType.Dialog)
+
+_LOG_LEVELS: Dict[str, int] = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
+@lru_cache(maxsize=None)
+def _user_cache_dir() -> Path:
+    """Directory for caches that can be safely deleted (e.g. parsed configuration files)."""
+    import platformdirs  # imported on first use, it is not needed until the profile is read
+    return Path(platformdirs.user_cache_dir(APP_NAME, APP_AUTHOR))
+
 
 class AppCore(QMainWindow):
     """
@@ -31,18 +58,29 @@ class AppCore(QMainWindow):
     APP_NAME = APP_NAME
     APP_AUTHOR = APP_AUTHOR
 
-    def __init__(self, profile_path: str):
+    # Managers are created in __init__; the class-level defaults keep closeEvent safe
+    # if construction failed half-way
+    event_bus: Optional[EventBus] = None
+    ui_manager: Optional[UIManager] = None
+    view_manager: Optional[ViewManager] = None
+    plugin_manager: Optional[PluginManager] = None
+    _shutting_down = False
+    # View restoration prepared by initialize(), run once the window has been shown
+    _pending_view_restore: Optional[Callable[[], None]] = None
+
+    def __init__(self, profile_path: str, profile_read: Optional["Future[Optional[Dict]]"] = None):
         super().__init__()
         self.profile_path = Path(profile_path)
         self.profile_name = self.profile_path.stem
+        # Read already started by start_profile_read(); initialize() awaits it instead of reading again
+        self._profile_read = profile_read
         self.config: Dict = {}
         self.profile_metadata: Dict = {}
 
-        logger.debug(f"AppCore ({self.profile_name}): Initializing...")
+        logger.debug("AppCore (%s): Initializing...", self.profile_name)
 
-        self._load_app_config()
         self.event_bus = EventBus()
-        self.state_manager = StateManager()
+        self.state_manager = StateManager(event_bus=self.event_bus)
         self.ui_manager = UIManager(main_window=self)
         self.ui_manager.initialize_ui()
         self.view_manager = ViewManager(app_core=self, ui_manager=self.ui_manager, parent=self)
@@ -51,135 +89,239 @@ class AppCore(QMainWindow):
             app_core=self, state_manager=self.state_manager, event_bus=self.event_bus
         )
 
-        theme = self.config.get("theme", "light")
-        apply_theme(self, theme)
-        profile_title = self.profile_metadata.get("title", self.profile_name)
-        self.setWindowTitle(f"just-gui: {profile_title}")
-        logger.debug(f"AppCore ({self.profile_name}): __init__ complete.")
+        self.setWindowTitle(f"just-gui: {self.profile_name}")
+        logger.debug("AppCore (%s): __init__ complete.", self.profile_name)
 
     async def initialize(self):
         """Asynchronous initialization."""
-        logger.info(f"AppCore ({self.profile_name}): Starting async initialization...")
+        logger.info("AppCore (%s): Starting async initialization...", self.profile_name)
         critical_error = None
+        # Both files are read on worker threads; the saved view state does not depend on the plugins,
+        # so it is read while they are loading
+        if self._profile_read is not None:
+            profile_read = asyncio.wrap_future(self._profile_read)
+            self._profile_read = None
+        else:
+            profile_read = asyncio.ensure_future(asyncio.to_thread(self._read_profile_sync))
+        state_file = self.view_state_file
+        view_state_read = asyncio.ensure_future(asyncio.to_thread(ViewManager.read_view_state, state_file))
+        await asyncio.sleep(0)  # let the tasks hand the reads to the executor before plugin loading starts
+
+        profile_data = None
         try:
-            await self.plugin_manager.load_profile(str(self.profile_path))
+            profile_data = await profile_read
+        except ConfigError as e:
+            logger.warning("Config loading error: %s.", e)
         except Exception as e:
-            logger.error(f"Critical error loading profile '{self.profile_name}': {e}", exc_info=True)
-            critical_error = e
+            logger.error("Unexpected config loading error: %s", e, exc_info=True)
+        self._apply_config(profile_data)
 
-        try:
-            self.view_manager.update_view_menu()
-            view_loaded = self.view_manager.load_view_state()
+        # Plugins register views, menu actions and toolbar widgets one by one; lay out and repaint
+        # the window once after all of them instead of after every registration
+        with self.suspend_ui_updates():
+            try:
+                await self.plugin_manager.load_profile(str(self.profile_path), profile_data)
+            except Exception as e:
+                logger.error("Critical error loading profile '%s': %s", self.profile_name, e, exc_info=True)
+                critical_error = e
 
-            if not view_loaded:
-                logger.info("Saved view not found or empty. Opening all available views by default...")
-                self.view_manager.open_all_declared_views()
+            try:
+                self.view_manager.update_view_menu()
+            except Exception as e:
+                logger.error("Error updating 'View' menu: %s", e, exc_info=True)
 
+        try:
+            view_state = await view_state_read
         except Exception as e:
-            logger.error(f"Error updating/loading view: {e}", exc_info=True)
-            if not critical_error:
-                QMessageBox.warning(self, "View Error", f"Failed to update or load view state:\n{e}")
+            self.view_manager.report_view_state_error(state_file, e)
+            view_state = None
+        # Tabs are restored only after the window has been shown (see showEvent),
+        # so the first paint does not wait for the view factories
+        self._pending_view_restore = partial(self._restore_views, view_state, critical_error is not None)
+        if self.isVisible():
+            self._schedule_view_restore()
 
-        logger.info(f"AppCore ({self.profile_name}): Async initialization complete.")
+        logger.info("AppCore (%s): Async initialization complete.", self.profile_name)
         if critical_error:
             QMessageBox.critical(self, "Profile Loading Error",
                                  f"A critical error occurred while loading plugins:\n{critical_error}\n\n"
                                  "Some functionality may be unavailable.")
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._schedule_view_restore()
+
+    def _schedule_view_restore(self):
+        """Queues the view restoration prepared by initialize(), if it has not run yet."""
+        restore, self._pending_view_restore = self._pending_view_restore, None
+        if restore is not None:
+            QTimer.singleShot(0, restore)
+
+    def _restore_views(self, view_state: Optional[Dict], profile_failed: bool):
+        """Opens the saved views (or all declared views if there are none). Scheduled once the window is shown."""
+        if self._shutting_down:
+            return
+        try:
+            with self.suspend_ui_updates():
+                view_loaded = self.view_manager.apply_view_state(view_state)
+                if not view_loaded:
+                    logger.info("Saved view not found or empty. Opening all available views by default...")
+                    self.view_manager.open_all_declared_views()
+        except Exception as e:
+            logger.error("Error loading view: %s", e, exc_info=True)
+            if not profile_failed:
+                QMessageBox.warning(self, "View Error", f"Failed to load view state:\n{e}")
+
         if self.view_manager.tab_widget and self.view_manager.tab_widget.count() == 0:
             self.update_status("Plugins loaded, but no views available or failed to open.", 5000)
-        elif not critical_error:
+        elif not profile_failed:
             self.update_status("Ready", 3000)
 
-    def _load_app_config(self):
-        logger.debug(f"Loading application configuration from {self.profile_path}")
+    @classmethod
+    def start_profile_read(cls, profile_path: str) -> "Future[Optional[Dict]]":
+        """
+        Starts reading and parsing the profile file on a worker thread and returns its future.
+        Needs neither a QApplication nor an event loop, so the read can overlap with Qt start-up;
+        pass the future to AppCore(profile_read=...).
+        """
+        path = Path(profile_path)
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="just-gui-profile")
+        try:
+            # The cache directory lookup (platformdirs import) also happens on the worker
+            return executor.submit(lambda: cls._read_profile_file(path, _user_cache_dir()))
+        finally:
+            executor.shutdown(wait=False)
+
+    def _read_profile_sync(self) -> Optional[Dict]:
+        """Reads and parses the profile file. Safe to run in a worker thread."""
+        return self._read_profile_file(self.profile_path, self.cache_dir)
+
+    @staticmethod
+    def _read_profile_file(profile_path: Path, cache_dir: Path) -> Optional[Dict]:
+        """
+        Reads and parses a profile file. Touches no Qt objects, so it is safe to run in a worker thread.
+        Returns None if the profile file does not exist.
+        """
+        logger.debug("Loading application configuration from %s", profile_path)
         try:
-            if not self.profile_path.is_file():
-                logger.warning(f"Profile file not found: {self.profile_path}.")
-                self.config = {}
-                return
-            profile_data = load_toml(self.profile_path)
-            self.config = profile_data.get("config", {})
-            self.profile_metadata = profile_data.get("profile_metadata", {})
-            log_level_str = self.config.get("log_level", "INFO").upper()
-            try:
-                log_level = getattr(logging, log_level_str, logging.INFO)
-                package_logger = logging.getLogger('just_gui')
-                package_logger.setLevel(log_level)
-                if not package_logger.handlers:
-                    handler = logging.StreamHandler(sys.stdout)
-                    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-                    handler.setFormatter(formatter)
-                    package_logger.addHandler(handler)
-                    package_logger.propagate = False
-                logger.info(f"'just_gui' logging level: {log_level_str}")
-            except AttributeError:
-                logger.warning(f"Invalid logging level '{log_level_str}'.")
-                logging.getLogger(
-                    'just_gui').setLevel(logging.INFO)
-        except ConfigError as e:
-            logger.warning(f"Config loading error: {e}.")
-            self.config = {}
-        except Exception as e:
-            logger.error(f"Unexpected config loading error: {e}", exc_info=True)
-            self.config = {}
+            return load_toml(profile_path, cache_dir=cache_dir)
+        except FileNotFoundError:
+            logger.warning("Profile file not found: %s.", profile_path)
+            return None
+
+    def _apply_config(self, profile_data: Optional[Dict]):
+        """Applies the parsed profile: logging level, theme and window title. Must run on the GUI thread."""
+        profile_data = profile_data or {}
+        self.config = profile_data.get("config", {})
+        self.profile_metadata = profile_data.get("profile_metadata", {})
+        log_level_str = str(self.config.get("log_level", "INFO")).upper()
+        log_level = _LOG_LEVELS.get(log_level_str)
+        if log_level is None:
+            logger.warning("Invalid logging level '%s'.", log_level_str)
+            log_level, log_level_str = logging.INFO, "INFO"
+        # Handlers are configured once by cli.setup_logging (or by the embedding application)
+        logging.getLogger('just_gui').setLevel(log_level)
+        logger.info("'just_gui' logging level: %s", log_level_str)
+
+        theme = self.config.get("theme", "light")
+        apply_theme(self, theme, cache_dir=self.cache_dir)
+        profile_title = self.profile_metadata.get("title", self.profile_name)
+        self.setWindowTitle(f"just-gui: {profile_title}")
 
     def closeEvent(self, event):
-        logger.info(f"AppCore ({self.profile_name}): Received close event.")
-        if hasattr(self, 'view_manager') and self.view_manager:
-            self.view_manager.save_view_state()
+        logger.info("AppCore (%s): Received close event.", self.profile_name)
+        if self._shutting_down:
+            event.ignore()
+            return
+        self._shutting_down = True
+        # The view state is read from the tabs, so collect it before anything is torn down;
+        # the file itself is written on a pool thread while the plugins unload
+        if self.view_manager:
+            self.view_manager.save_view_state_in_background()
         else:
             logger.warning("ViewManager not found on close.")
-        if hasattr(self, 'plugin_manager') and self.plugin_manager:
+        # Hide right away and tear the plugins down on the next event loop iteration, so the window
+        # disappears without waiting for plugin cleanup. on_unload() may touch Qt objects,
+        # so it stays on the GUI thread.
+        event.ignore()
+        self.hide()
+        QTimer.singleShot(0, self._finish_shutdown)
+
+    def _finish_shutdown(self):
+        """
+        Unloads plugins and stops the event bus (second half of closeEvent). Quits the application
+        the way closing the last window would, i.e. only if quitOnLastWindowClosed is set
+        and no other top-level window is still visible.
+        """
+        if self.plugin_manager:
             try:
                 self.plugin_manager.unload_all()
             except Exception as e:
-                logger.error(f"Error unloading plugins: {e}", exc_info=True)
+                logger.error("Error unloading plugins: %s", e, exc_info=True)
         else:
             logger.warning("PluginManager not found on close.")
-        event.accept()
-        logger.info(f"AppCore ({self.profile_name}): Application is shutting down.")
+        if self.event_bus:
+            self.event_bus.shutdown()
+        if not QThreadPool.globalInstance().waitForDone(_SHUTDOWN_WRITE_TIMEOUT_MS):
+            logger.warning("Background writes did not finish within %s ms.", _SHUTDOWN_WRITE_TIMEOUT_MS)
+        if QApplication.quitOnLastWindowClosed() and not self._other_windows_visible():
+            logger.info("AppCore (%s): Application is shutting down.", self.profile_name)
+            QApplication.quit()
+        else:
+            logger.info("AppCore (%s): Window closed, other windows keep the application running.",
+                        self.profile_name)
+
+    def _other_windows_visible(self) -> bool:
+        """True if another visible top-level window would keep Qt from quitting on 'last window closed'."""
+        return any(
+            widget is not self and widget.isVisible()
+            and widget.windowType() in _QUIT_RELEVANT_WINDOW_TYPES
+            and widget.testAttribute(Qt.WidgetAttribute.WA_QuitOnClose)
+            for widget in QApplication.topLevelWidgets()
+        )
 
     def update_status(self, message: str, timeout: int = 0):
         """
         Updates the status bar message.
         """
-        if hasattr(self, 'ui_manager') and self.ui_manager:
-            self.ui_manager.update_status(message, timeout)
+        self.ui_manager.update_status(message, timeout)
+
+    @contextmanager
+    def suspend_ui_updates(self):
+        """Disables main window repaints for the duration of the block (delegates to UIManager)."""
+        with self.ui_manager.suspend_updates():
+            yield
 
     def declare_view(self, plugin_name: str, view_id: str, name: str, factory: 'ViewFactory'):
         """
         Declares a view provided by a plugin.
         """
-        if hasattr(self, 'view_manager') and self.view_manager:
-            self.view_manager.declare_view(plugin_name, view_id, name, factory)
-        else:
-            logger.error("ViewManager is not initialized.")
+        self.view_manager.declare_view(plugin_name, view_id, name, factory)
 
     def register_menu_action(self, plugin_name: str, menu_path: str, action: 'QAction'):
         """
         Registers a QAction under a specific menu path.
         """
-        if hasattr(self, 'ui_manager') and self.ui_manager:
-            self.ui_manager.register_menu_action(plugin_name, menu_path, action)
-        else:
-            logger.error("UIManager is not initialized.")
+        self.ui_manager.register_menu_action(plugin_name, menu_path, action)
 
     def register_toolbar_widget(self, section_path: str, widget: 'QWidget'):
         """
         Registers a QWidget in a specific toolbar section.
         """
-        if hasattr(self, 'ui_manager') and self.ui_manager:
-            self.ui_manager.register_toolbar_widget(section_path, widget)
-        else:
-            logger.error("UIManager is not initialized.")
+        self.ui_manager.register_toolbar_widget(section_path, widget)
+
+    @cached_property
+    def cache_dir(self) -> Path:
+        """Returns _user_cache_dir()."""
+        return _user_cache_dir()
 
-    @property
+    @cached_property
     def view_state_file(self) -> Path:
         """
         Provides the path to the file where the view state for the current profile is saved.
+        Computed once per AppCore. Pure path arithmetic: the directory is created only when
+        the view state is saved (ViewManager.save_view_state), so startup does no mkdir.
         """
+        import platformdirs
         config_dir = Path(platformdirs.user_config_dir(self.APP_NAME, self.APP_AUTHOR))
-        profile_view_dir = config_dir / "profiles" / self.profile_name
-        profile_view_dir.mkdir(parents=True, exist_ok=True)
-        return profile_view_dir / "view_state.json"
\ No newline at end of file
+        return config_dir / "profiles" / self.profile_name / "view_state.json"
\ No newline at end of file
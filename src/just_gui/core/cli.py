@@ -1,17 +1,61 @@
 # src/just_gui/core/cli.py
-import argparse
 import asyncio
+import atexit
 import logging
+import queue
 import sys
+import threading
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from typing import List, Optional, Tuple
 from PySide6.QtWidgets import QApplication, QMessageBox
-import qasync
-# from platformdirs import user_config_dir # Can import here, but used in AppCore
 
 from .app import AppCore, APP_NAME, APP_AUTHOR  # <-- Import constants
 
 
+class _BatchedConsoleHandler(MemoryHandler):
+    """
+    MemoryHandler whose target is a StreamHandler: a flush formats the whole buffer with the
+    target's formatter and writes it to the stream with a single write() and flush().
+    """
+
+    def flush(self):
+        with self.lock:
+            target = self.target
+            if target is None or not self.buffer:
+                return
+            records = self.buffer
+            self.buffer = []
+        try:
+            text = "".join(target.format(record) + target.terminator for record in records)
+            with target.lock:
+                target.stream.write(text)
+                target.stream.flush()
+        except Exception:
+            self.handleError(records[-1])
+
+
+# Writes queued log records to the console on its own thread (see setup_logging)
+_log_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+# Console handler attached directly to the 'just_gui' logger after stop_logging()
+_direct_handler: Optional[logging.Handler] = None
+# Batches console writes; flushed when full, on ERROR records and periodically
+_log_buffer: Optional[_BatchedConsoleHandler] = None
+_log_flush_stop = threading.Event()
+_LOG_BUFFER_CAPACITY = 512
+_LOG_FLUSH_INTERVAL_S = 1.0
+
+
+def _flush_log_buffer_periodically():
+    while not _log_flush_stop.wait(_LOG_FLUSH_INTERVAL_S):
+        buffer = _log_buffer
+        if buffer is not None:
+            buffer.flush()
+
+
 # Basic logging setup (can be moved to a separate function)
 def setup_logging():
+    global _log_listener, _log_buffer, _queue_handler, _direct_handler
     # Configure the root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.WARNING)  # Default for other libraries - WARNING
@@ -22,14 +66,36 @@ def setup_logging():
     app_logger.setLevel(logging.DEBUG)
     app_logger.propagate = False  # Do not propagate messages to root
 
-    # Create a handler for console output
-    handler = logging.StreamHandler(sys.stdout)
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    handler.setFormatter(formatter)
+    if _log_listener is not None:
+        return  # already running
+    if _direct_handler is not None:
+        # Re-armed after stop_logging(): the queue takes over from the direct handler again
+        app_logger.removeHandler(_direct_handler)
+        _direct_handler = None
 
     # Add the handler to our logger
     if not app_logger.handlers:
-        app_logger.addHandler(handler)
+        _log_flush_stop.clear()
+        # Create a handler for console output. QueueHandler.prepare() still merges the message args and
+        # renders any traceback on the calling thread; only the line formatting and the blocking write
+        # to stdout happen on the listener thread
+        handler = logging.StreamHandler(sys.stdout)
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handler.setFormatter(formatter)
+
+        # Records reach stdout in batches of up to _LOG_BUFFER_CAPACITY lines instead of one write each;
+        # errors are written immediately, everything else at least every _LOG_FLUSH_INTERVAL_S
+        _log_buffer = _BatchedConsoleHandler(_LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=handler,
+                                             flushOnClose=True)
+
+        log_queue = queue.SimpleQueue()
+        _queue_handler = QueueHandler(log_queue)
+        app_logger.addHandler(_queue_handler)
+        _log_listener = QueueListener(log_queue, _log_buffer, respect_handler_level=True)
+        _log_listener.start()
+        threading.Thread(target=_flush_log_buffer_periodically, name="just_gui-log-flush", daemon=True).start()
+        atexit.unregister(stop_logging)
+        atexit.register(stop_logging)
 
     # Can add a FileHandler if needed
     # file_handler = logging.FileHandler("app.log")
@@ -37,12 +103,66 @@ def setup_logging():
     # app_logger.addHandler(file_handler)
 
 
-setup_logging()  # Call logging setup when the module is loaded
+def stop_logging():
+    """
+    Writes out the queued and buffered log records and stops the logging threads.
+    Records logged afterwards (plugin unloads, Qt teardown) go straight to the console.
+    Safe to call more than once; setup_logging() re-arms the queue.
+    """
+    global _log_listener, _log_buffer, _queue_handler, _direct_handler
+    _log_flush_stop.set()
+    app_logger = logging.getLogger('just_gui')
+    if _queue_handler is not None:
+        app_logger.removeHandler(_queue_handler)
+        _queue_handler = None
+    if _log_listener is not None:
+        _log_listener.stop()  # drains the queue into the buffer
+        _log_listener = None
+    if _log_buffer is not None:
+        console_handler = _log_buffer.target
+        _log_buffer.close()  # flushes the remaining records (flushOnClose)
+        _log_buffer = None
+        if console_handler is not None:
+            app_logger.addHandler(console_handler)
+            _direct_handler = console_handler
+
+
 logger = logging.getLogger(__name__)  # Get logger for cli (__name__ will be 'just_gui.core.cli')
 
 
-def main():
-    """Main function to run the application."""
+# asyncio integrations with the Qt event loop, selected with --event-loop
+_EVENT_LOOPS = ("qasync", "qtasyncio")
+_DEFAULT_EVENT_LOOP = "qasync"
+
+
+def _create_event_loop(qapp: QApplication, backend: str = _DEFAULT_EVENT_LOOP) -> asyncio.AbstractEventLoop:
+    """
+    Creates an asyncio event loop driven by the Qt event loop.
+    'qasync' (default) uses qasync.QEventLoop; 'qtasyncio' uses the QtAsyncio loop shipped with PySide6,
+    which is still a technical preview with an incomplete event loop API (e.g. network transports).
+    """
+    if backend == "qtasyncio":
+        from PySide6.QtAsyncio import QAsyncioEventLoopPolicy
+        asyncio.set_event_loop_policy(QAsyncioEventLoopPolicy(qapp))
+        logger.debug("Using PySide6 QtAsyncio event loop.")
+        return asyncio.new_event_loop()
+    import qasync
+    logger.debug("Using qasync event loop.")
+    return qasync.QEventLoop(qapp)
+
+
+def _parse_args(argv: List[str]) -> Tuple[str, str]:
+    """
+    Returns the (profile path, event loop backend) from the command line arguments.
+    The usual `--profile PATH` and `--profile=PATH` forms are read directly; anything else
+    (-h/--help, --event-loop, unknown or missing arguments) goes through argparse.
+    """
+    if len(argv) == 2 and argv[0] == "--profile" and not argv[1].startswith("-"):
+        return argv[1], _DEFAULT_EVENT_LOOP
+    if len(argv) == 1 and argv[0].startswith("--profile=") and argv[0] != "--profile=":
+        return argv[0][len("--profile="):], _DEFAULT_EVENT_LOOP
+
+    import argparse
     parser = argparse.ArgumentParser(description="Run the just-gui application.")
     parser.add_argument(
         "--profile",
@@ -50,11 +170,27 @@ def main():
         required=True,
         help="Path to the application profile file (*.toml)",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--event-loop",
+        choices=_EVENT_LOOPS,
+        default=_DEFAULT_EVENT_LOOP,
+        help="asyncio integration with the Qt event loop (default: %(default)s; "
+             "'qtasyncio' is a PySide6 technical preview)",
+    )
+    args = parser.parse_args(argv)
+    return args.profile, args.event_loop
+
+
+def main():
+    """Main function to run the application."""
+    setup_logging()
+    profile, event_loop_backend = _parse_args(sys.argv[1:])
 
-    logger.info(f"Starting just-gui with profile: {args.profile}")
+    logger.info("Starting just-gui with profile: %s", profile)
+    # The profile is read and parsed on a worker thread while Qt starts up
+    profile_read = AppCore.start_profile_read(profile)
 
-    # Creating QApplication BEFORE the qasync event loop
+    # Creating QApplication BEFORE the asyncio event loop
     # Use try...except for QApplication as it might already exist
     try:
         qapp = QApplication.instance()
@@ -68,15 +204,15 @@ def main():
         print(f"Critical error creating QApplication: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Setup qasync
-    loop = qasync.QEventLoop(qapp)
+    # Setup the Qt-driven asyncio loop
+    loop = _create_event_loop(qapp, event_loop_backend)
     asyncio.set_event_loop(loop)
     app_core = None  # Initialize the variable
 
     try:
         # --- Step 1: Create AppCore instance (synchronous) ---
         logger.debug("Creating AppCore instance...")
-        app_core = AppCore(profile_path=args.profile)
+        app_core = AppCore(profile_path=profile, profile_read=profile_read)
         logger.debug("AppCore instance created.")
 
         # --- Step 2: Asynchronous initialization (plugin loading, view restoration) ---
@@ -92,15 +228,14 @@ def main():
         logger.debug("Main window displayed.")
 
         # --- Step 4: Start the main event loop ---
-        with loop:
-            logger.info("Starting the main event loop...")
-            loop.run_forever()  # Start the infinite Qt event loop
+        logger.info("Starting the main event loop...")
+        loop.run_forever()  # Start the infinite Qt event loop
 
         logger.info("Main event loop finished.")
         # Code after loop.run_forever() will execute after the application closes (when the window is closed)
 
     except Exception as e:
-        logger.critical(f"Unhandled top-level exception: {e}", exc_info=True)
+        logger.critical("Unhandled top-level exception: %s", e, exc_info=True)
         # Show critical error to user if GUI is still running
         try:
             # QMainWindow might be unavailable, use None as parent
@@ -125,6 +260,7 @@ def main():
         logger.debug("Closing asyncio event loop...")
         loop.close()
         logger.info("Asyncio event loop closed.")
+        stop_logging()
         # sys.exit(0) # Normal exit if no errors occurred (already happens via app.exec())
 
 
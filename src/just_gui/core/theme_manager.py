@@ -1,60 +1,147 @@
 # src/just_gui/core/theme_manager.py
+import importlib.util
 import logging
+import os
+import weakref
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from PySide6.QtCore import qVersion
 from PySide6.QtWidgets import QWidget
 
 logger = logging.getLogger(__name__)
 
+_QDARKTHEME_THEMES = frozenset(("dark", "light"))
+
+# Set once qdarktheme turned out to be missing; the import/find_spec lookup is not repeated after that
+_qdarktheme_missing = False
+
+# Theme last applied to each widget; re-applying the same one would only re-parse QSS and re-polish children
+_applied_themes: "weakref.WeakKeyDictionary[QWidget, str]" = weakref.WeakKeyDictionary()
+# Stylesheet last set on each widget; different theme names can resolve to the same sheet (e.g. "" for the system theme)
+_applied_styles: "weakref.WeakKeyDictionary[QWidget, str]" = weakref.WeakKeyDictionary()
+
+# Fallback dark style used when qdarktheme is not installed
+_BASIC_DARK_QSS = """
+    QWidget { background-color: #2d2d2d; color: #f0f0f0; border: none; }
+    QMainWindow { background-color: #2d2d2d; }
+    QMenuBar { background-color: #3c3c3c; color: #f0f0f0; }
+    QMenuBar::item:selected { background-color: #555; }
+    QMenu { background-color: #3c3c3c; color: #f0f0f0; border: 1px solid #555; }
+    QMenu::item:selected { background-color: #555; }
+    QToolBar { background-color: #3c3c3c; border: none; padding: 2px; }
+    QStatusBar { background-color: #3c3c3c; color: #f0f0f0; }
+    QTabWidget::pane { border: 1px solid #444; }
+    QTabBar::tab { background: #3c3c3c; color: #f0f0f0; padding: 5px; border: 1px solid #444; border-bottom: none; }
+    QTabBar::tab:selected { background: #555; }
+    QTabBar::tab:!selected { color: #a0a0a0; background: #2d2d2d;}
+    QTabBar::close-button { image: url(:/qt-project.org/styles/commonstyle/images/standardbutton-close-16.png); subcontrol-position: right; }
+    QTabBar::close-button:hover { background: #555; }
+    QPushButton { background-color: #555; color: #f0f0f0; border: 1px solid #666; padding: 5px; min-width: 60px;}
+    QPushButton:hover { background-color: #666; }
+    QPushButton:pressed { background-color: #444; }
+    QLabel { color: #f0f0f0; background-color: transparent; }
+    QLineEdit { background-color: #3c3c3c; color: #f0f0f0; border: 1px solid #555; padding: 2px; }
+"""
+
+
+@lru_cache(maxsize=None)
+def _load_qdarktheme_sheet(theme: str, cache_dir: Optional[Path] = None) -> str:
+    """
+    Returns the qdarktheme stylesheet for 'dark' or 'light'.
+    Generated once per theme and process. With `cache_dir`, the generated sheet is also kept on disk,
+    so later launches read it without importing qdarktheme at all.
+    Raises ImportError if qdarktheme is not installed.
+    """
+    if cache_dir is None:
+        return _generate_qdarktheme_sheet(theme)
+
+    spec = importlib.util.find_spec("qdarktheme")
+    if spec is None or not spec.origin:
+        raise ImportError("qdarktheme is not installed")
+    # A reinstalled/upgraded qdarktheme or a different Qt version gives a new file name
+    stamp = os.stat(spec.origin).st_mtime_ns
+    cache_file = cache_dir / f"qdarktheme-{theme}-{stamp}-qt{qVersion()}.qss"
+    try:
+        return cache_file.read_text(encoding='utf-8')
+    except OSError:
+        pass
+
+    style = _generate_qdarktheme_sheet(theme)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix('.tmp')
+        tmp_file.write_text(style, encoding='utf-8')
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.debug("Could not cache stylesheet in %s: %s", cache_file, e)
+    return style
+
+
+def _get_qdarktheme_sheet(theme: str, cache_dir: Optional[Path]) -> str:
+    """
+    Same as _load_qdarktheme_sheet, but remembers a missing qdarktheme:
+    later calls raise ImportError right away instead of going through the import machinery again.
+    """
+    global _qdarktheme_missing
+    if _qdarktheme_missing:
+        raise ImportError("qdarktheme is not installed")
+    try:
+        return _load_qdarktheme_sheet(theme, cache_dir)
+    except ImportError:
+        _qdarktheme_missing = True
+        raise
 
-def apply_theme(target_widget: QWidget, theme_name: str):
-    """Applies a color theme to the specified widget."""
-    logger.info(f"Applying theme '{theme_name}'...")
+
+def _generate_qdarktheme_sheet(theme: str) -> str:
+    import qdarktheme
+    return qdarktheme.load_stylesheet(theme)
+
+
+def apply_theme(target_widget: QWidget, theme_name: str, cache_dir: Optional[Path] = None):
+    """
+    Applies a color theme to the specified widget. Does nothing if the widget already has this theme.
+    `cache_dir` enables the on-disk cache of generated qdarktheme stylesheets.
+    """
+    theme_key = theme_name.lower()
+    if _applied_themes.get(target_widget) == theme_key:
+        logger.debug("Theme '%s' is already applied, skipping.", theme_name)
+        return
+    logger.info("Applying theme '%s'...", theme_name)
     style = ""
     theme_applied_source = "system"
 
     try:
-        import qdarktheme
-        valid_qdark_themes = ["dark", "light"]
-        if theme_name.lower() in valid_qdark_themes:
-            style = qdarktheme.load_stylesheet(theme_name.lower())
+        if theme_key in _QDARKTHEME_THEMES:
+            style = _get_qdarktheme_sheet(theme_key, cache_dir)
             theme_applied_source = f"qdarktheme ({theme_name})"
-            logger.info(f"Applied qdarktheme '{theme_name}'.")
+            logger.info("Applied qdarktheme '%s'.", theme_name)
         else:
             logger.warning(
-                f"Theme '{theme_name}' is not supported by qdarktheme (expected 'light' or 'dark'). Using system theme.")
+                "Theme '%s' is not supported by qdarktheme (expected 'light' or 'dark'). Using system theme.", theme_name)
             style = ""
     except ImportError:
         logger.warning("qdarktheme library not found. Applying basic style.")
-        if theme_name.lower() == "dark":
-            style = """
-                QWidget { background-color: #2d2d2d; color: #f0f0f0; border: none; }
-                QMainWindow { background-color: #2d2d2d; }
-                QMenuBar { background-color: #3c3c3c; color: #f0f0f0; }
-                QMenuBar::item:selected { background-color: #555; }
-                QMenu { background-color: #3c3c3c; color: #f0f0f0; border: 1px solid #555; }
-                QMenu::item:selected { background-color: #555; }
-                QToolBar { background-color: #3c3c3c; border: none; padding: 2px; }
-                QStatusBar { background-color: #3c3c3c; color: #f0f0f0; }
-                QTabWidget::pane { border: 1px solid #444; }
-                QTabBar::tab { background: #3c3c3c; color: #f0f0f0; padding: 5px; border: 1px solid #444; border-bottom: none; }
-                QTabBar::tab:selected { background: #555; }
-                QTabBar::tab:!selected { color: #a0a0a0; background: #2d2d2d;}
-                QTabBar::close-button { image: url(:/qt-project.org/styles/commonstyle/images/standardbutton-close-16.png); subcontrol-position: right; }
-                QTabBar::close-button:hover { background: #555; }
-                QPushButton { background-color: #555; color: #f0f0f0; border: 1px solid #666; padding: 5px; min-width: 60px;}
-                QPushButton:hover { background-color: #666; }
-                QPushButton:pressed { background-color: #444; }
-                QLabel { color: #f0f0f0; background-color: transparent; }
-                QLineEdit { background-color: #3c3c3c; color: #f0f0f0; border: 1px solid #555; padding: 2px; }
-            """
+        if theme_key == "dark":
+            style = _BASIC_DARK_QSS
             theme_applied_source = "basic dark"
         else:
             style = ""
             theme_applied_source = "system/basic light"
             logger.info("Applied system theme (light).")
 
+    if _applied_styles.get(target_widget) == style:
+        # setStyleSheet() re-polishes the whole widget tree even for an identical sheet
+        _applied_themes[target_widget] = theme_key
+        logger.debug("Stylesheet for theme '%s' is unchanged, not re-applying.", theme_name)
+        return
+
     try:
         target_widget.setStyleSheet(style)
+        _applied_styles[target_widget] = style
+        _applied_themes[target_widget] = theme_key
     except Exception as e:
-        logger.error(f"Error applying theme style '{theme_name}': {e}", exc_info=True)
+        logger.error("Error applying theme style '%s': %s", theme_name, e, exc_info=True)
 
-    logger.debug(f"Source of applied theme: {theme_applied_source}")
\ No newline at end of file
+    logger.debug("Source of applied theme: %s", theme_applied_source)
\ No newline at end of file
@@ -1,20 +1,54 @@
 # src/just_gui/core/ui_manager.py
 import logging
-from typing import Dict, Optional, TYPE_CHECKING, cast
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from itertools import accumulate
+from typing import Dict, Optional, Set, TYPE_CHECKING, Tuple, cast
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QTabWidget, QToolBar, QStatusBar,
     QMenuBar, QMessageBox, QMenu
 )
 from PySide6.QtGui import QAction, QIcon
-from PySide6.QtCore import QSize
+from PySide6.QtCore import QSize, QTimer
 
-from typing import cast
+from .. import __version__
 
 if TYPE_CHECKING:
     from .app import AppCore
 
 logger = logging.getLogger(__name__)
 
+# Translation table for removing mnemonic ampersands from menu/action texts
+_AMP_STRIP = str.maketrans('', '', '&')
+
+
+@lru_cache(maxsize=256)
+def _strip_amp(text: str) -> str:
+    """Returns the text without mnemonic ampersands; menu and action texts repeat, so results are cached."""
+    return text.translate(_AMP_STRIP)
+
+
+# Library part of the 'About' dialog; it does not change while the application runs
+_ABOUT_LIBRARY_HTML = "<br>".join([
+    "<b>just-gui Library</b>",
+    f"Version: {__version__}",
+    "© 2025 DIMNISSV. MIT License.",
+    "<a href=\"https://github.com/DIMNISSV/just-gui\">GitHub</a>",
+    "<hr>",
+])
+
+# Prefix of the objectName given to every menu we create, followed by its full path (e.g. "jg_menu::View/Counter")
+_MENU_OBJECT_PREFIX = "jg_menu::"
+
+# Status bar messages are shown at most this often (~30 Hz); intermediate ones are dropped
+_STATUS_FLUSH_INTERVAL_MS = 33
+
+
+@lru_cache(maxsize=None)
+def _theme_icon(name: str) -> QIcon:
+    """Returns the icon-theme icon by name, looked up once per process (needs a QApplication)."""
+    return QIcon.fromTheme(name)
+
 
 class UIManager:
     """Manages core UI elements, menus, and toolbars."""
@@ -26,8 +60,15 @@ class UIManager:
         self.tab_widget: Optional[QTabWidget] = None
         self.status_bar: Optional[QStatusBar] = None
         self._all_menus_cache: Dict[str, QMenu] = {}
+        # Texts of the actions in each menu (by full path), for O(1) duplicate checks in register_menu_action
+        self._menu_action_texts: Dict[str, Set[str]] = {}
+        # menu_path as passed by callers -> (path parts, full path of every prefix), see _split_menu_path
+        self._menu_path_parts_cache: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
         self._toolbars: Dict[str, QToolBar] = {}
         self._view_menu: Optional[QMenu] = None
+        self._suspend_level = 0
+        self._status_timer: Optional[QTimer] = None
+        self._pending_status: Optional[Tuple[str, int]] = None
 
     def initialize_ui(self):
         """Initializes the main UI elements of the main window."""
@@ -53,6 +94,10 @@ class UIManager:
 
         self.status_bar = QStatusBar(self.main_window)
         self.main_window.setStatusBar(self.status_bar)
+        self._status_timer = QTimer(self.main_window)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(_STATUS_FLUSH_INTERVAL_MS)
+        self._status_timer.timeout.connect(self._flush_status)
         self.update_status("Initializing...", 0)
 
         self._setup_default_menus()
@@ -63,21 +108,21 @@ class UIManager:
         assert self.menu_bar is not None
 
         file_menu = self.menu_bar.addMenu("&File")
-        self._all_menus_cache["File"] = file_menu
-        exit_icon = QIcon.fromTheme("application-exit")
+        self._remember_menu("File", file_menu)
+        exit_icon = _theme_icon("application-exit")
         exit_action = QAction(exit_icon, "&Exit", self.main_window)
         exit_action.triggered.connect(self.main_window.close)
         file_menu.addAction(exit_action)  # Add Exit to the end
 
         self._view_menu = self.menu_bar.addMenu("&View")
-        self._all_menus_cache["View"] = self._view_menu
+        self._remember_menu("View", self._view_menu)
 
         tools_menu = self.menu_bar.addMenu("&Tools")
-        self._all_menus_cache["Tools"] = tools_menu
+        self._remember_menu("Tools", tools_menu)
 
         help_menu = self.menu_bar.addMenu("&Help")
-        self._all_menus_cache["Help"] = help_menu
-        about_icon = QIcon.fromTheme("help-about")
+        self._remember_menu("Help", help_menu)
+        about_icon = _theme_icon("help-about")
         about_action = QAction(about_icon, "&About", self.main_window)
         about_action.triggered.connect(self.show_about_dialog)
         help_menu.addAction(about_action)
@@ -87,132 +132,178 @@ class UIManager:
         return self._view_menu
 
     def find_or_create_menu(self, menu_path: str) -> Optional[QMenu]:
-        """Finds or creates a menu/submenu."""
-        full_path = menu_path.strip('/')
-        if not full_path:
+        """
+        Finds or creates a menu/submenu.
+        The cache holds every menu under its full path and is the source of truth: a child is
+        looked up by its path (parent path + '/' + title) in O(1), never by scanning Qt children
+        or actions, and only the missing tail of the path is created.
+        """
+        parts, path_keys = self._split_menu_path(menu_path)
+        if not parts:
             logger.error("Empty menu path.")
             return None
 
-        if full_path in self._all_menus_cache:
-            cached_menu = self._all_menus_cache[full_path]
-            try:
-                _ = cached_menu.title()
-                logger.debug(f"Cache hit: '{full_path}'")
-                return cached_menu
-            except RuntimeError:
-                logger.warning(f"Cache '{full_path}' removed.")
-                del self._all_menus_cache[full_path]
-
-        parts = full_path.split('/')
+        full_path = path_keys[-1]
+        cached_menu = self._all_menus_cache.get(full_path)
+        if cached_menu is not None:
+            logger.debug("Cache hit: '%s'", full_path)
+            return cached_menu
+
+        # Deepest already existing prefix of the path
+        depth = len(parts) - 1
         current_menu_obj: Optional[QMenu] = None
-        current_path_part = ""
-        root_name = parts[0]
-        current_path_part = root_name
-        if current_path_part in self._all_menus_cache:
-            cached_root = self._all_menus_cache[current_path_part]
-            try:
-                _ = cached_root.title()
-                current_menu_obj = cached_root
-            except RuntimeError:
-                del self._all_menus_cache[current_path_part]
-                current_menu_obj = None
-
-        if current_menu_obj is None:
-            if not self.menu_bar:
-                logger.error("MenuBar not initialized.")
-                return None
-            found_root = None
-            for action in self.menu_bar.actions():
-                menu = action.menu()
-                if menu and menu.title().replace('&', '') == root_name:
-                    found_root = menu
-                    break
-            if found_root:
-                current_menu_obj = found_root
-            else:
-                menu_text = f"&{root_name}" if '&' not in root_name else root_name
-                current_menu_obj = self.menu_bar.addMenu(menu_text)
-            if current_menu_obj:
-                self._all_menus_cache[current_path_part] = current_menu_obj
-            else:
-                logger.error(f"Failed to create root menu '{root_name}'")
-                return None
+        while depth > 0:
+            current_menu_obj = self._all_menus_cache.get(path_keys[depth - 1])
+            if current_menu_obj is not None:
+                break
+            depth -= 1
+
+        if current_menu_obj is None and not self.menu_bar:
+            logger.error("MenuBar not initialized.")
+            return None
 
-        for i in range(1, len(parts)):
+        for i in range(depth, len(parts)):
             part_name = parts[i]
-            current_path_part += f"/{part_name}"
-            next_menu_obj: Optional[QMenu] = None
-            if current_path_part in self._all_menus_cache:
-                cached_submenu = self._all_menus_cache[current_path_part]
-                try:
-                    _ = cached_submenu.title()
-                    next_menu_obj = cached_submenu
-                except RuntimeError:
-                    del self._all_menus_cache[current_path_part]
-                    next_menu_obj = None
-            if next_menu_obj is None:
-                found_submenu = None
-                for action in current_menu_obj.actions():
-                    submenu = action.menu()
-                    if submenu and submenu.title().replace('&', '') == part_name:
-                        try:
-                            _ = submenu.title()
-                            found_submenu = submenu
-                            break
-                        except RuntimeError:
-                            logger.warning(f"Removed submenu '{part_name}'.")
-                            current_menu_obj.removeAction(action)
-                            action.deleteLater()
-                if found_submenu:
-                    next_menu_obj = found_submenu
-                else:
-                    menu_text = f"&{part_name}" if '&' not in part_name else part_name
-                    next_menu_obj = current_menu_obj.addMenu(menu_text)
-                if next_menu_obj:
-                    self._all_menus_cache[current_path_part] = next_menu_obj
-                else:
-                    logger.error(f"Failed to create submenu '{part_name}'")
-                    return None
-            current_menu_obj = next_menu_obj
+            menu_text = f"&{part_name}" if '&' not in part_name else part_name
+            parent = current_menu_obj if current_menu_obj is not None else self.menu_bar
+            current_menu_obj = parent.addMenu(menu_text)
+            if not current_menu_obj:
+                logger.error("Failed to create menu '%s'", part_name)
+                return None
+            self._remember_menu(path_keys[i], current_menu_obj)
         return current_menu_obj
 
+    def _split_menu_path(self, menu_path: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Returns the parts of a menu path and the full path of each prefix,
+        e.g. "View/Plugin" -> (("View", "Plugin"), ("View", "View/Plugin")). Cached per distinct menu_path.
+        """
+        split = self._menu_path_parts_cache.get(menu_path)
+        if split is None:
+            full_path = menu_path.strip('/')
+            parts = tuple(full_path.split('/')) if full_path else ()
+            split = self._menu_path_parts_cache[menu_path] = (parts, tuple(accumulate(parts, lambda a, b: f"{a}/{b}")))
+        return split
+
+    def _remember_menu(self, path: str, menu: QMenu):
+        """Caches a menu under its full path and tags it with a matching objectName (for debugging and styling)."""
+        menu.setObjectName(_MENU_OBJECT_PREFIX + path)
+        # Entries are evicted when Qt deletes the menu, so cache hits can be trusted without probing the C++ object
+        menu.destroyed.connect(partial(self._on_menu_destroyed, path))
+        self._all_menus_cache[path] = menu
+
+    def _on_menu_destroyed(self, path: str, _obj=None):
+        """Evicts a deleted menu from the cache (connected to QMenu.destroyed)."""
+        self._menu_action_texts.pop(path, None)
+        if self._all_menus_cache.pop(path, None) is not None:
+            logger.debug("Menu '%s' destroyed, removed from cache.", path)
+
+    def clear_menu(self, menu_path: str) -> Optional[QMenu]:
+        """Removes all actions from the menu at `menu_path` (creating it if needed) and returns it."""
+        menu = self.find_or_create_menu(menu_path)
+        if menu:
+            menu.clear()
+            self._menu_action_texts.pop(self._split_menu_path(menu_path)[1][-1], None)
+        return menu
+
+    def _get_menu_action_texts(self, path: str, menu: QMenu) -> Set[str]:
+        """Returns the action-text set of a menu, seeded from its current actions on first use."""
+        texts = self._menu_action_texts.get(path)
+        if texts is None:
+            texts = self._menu_action_texts[path] = {a.text() for a in menu.actions()}
+        return texts
+
+    def _forget_menu_action(self, path: str, text: str, _obj=None):
+        """Drops a deleted action's text from its menu's set (connected to QAction.destroyed)."""
+        texts = self._menu_action_texts.get(path)
+        if texts is not None:
+            texts.discard(text)
+
+    @contextmanager
+    def suspend_updates(self):
+        """
+        Context manager that disables repaints of the main window, the menu bar and the tab widget
+        while several UI elements are registered. Can be nested; updates are
+        re-enabled when the outermost block exits.
+        """
+        self._suspend_level += 1
+        if self._suspend_level == 1:
+            self.main_window.setUpdatesEnabled(False)
+            if self.menu_bar:
+                self.menu_bar.setUpdatesEnabled(False)
+            if self.tab_widget:
+                self.tab_widget.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self._suspend_level -= 1
+            if self._suspend_level == 0:
+                if self.tab_widget:
+                    self.tab_widget.setUpdatesEnabled(True)
+                if self.menu_bar:
+                    self.menu_bar.setUpdatesEnabled(True)
+                self.main_window.setUpdatesEnabled(True)
+
     # --- API for plugins ---
     def register_menu_action(self, plugin_name: str, menu_path: str, action: QAction):
         target_menu = self.find_or_create_menu(menu_path)
         if target_menu:
-            action_text = action.text().replace('&', '')
-            logger.debug(
-                f"Adding action '{action_text}' to menu '{target_menu.title().replace('&', '')}' (plugin: {plugin_name})")
-            for existing_action in target_menu.actions():
-                if existing_action.text() == action.text():
-                    logger.warning(
-                        f"Action '{action_text}' already exists in menu '{target_menu.title().replace('&', '')}'. Skipping.")
-                    return
+            raw_text = action.text()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Adding action '%s' to menu '%s' (plugin: %s)",
+                             _strip_amp(raw_text), _strip_amp(target_menu.title()), plugin_name)
+            full_path = self._split_menu_path(menu_path)[1][-1]
+            existing_texts = self._get_menu_action_texts(full_path, target_menu)
+            if raw_text in existing_texts:
+                logger.warning("Action '%s' already exists in menu '%s'. Skipping.",
+                               _strip_amp(raw_text), _strip_amp(target_menu.title()))
+                return
             target_menu.addAction(action)
+            existing_texts.add(raw_text)
+            action.destroyed.connect(partial(self._forget_menu_action, full_path, raw_text))
         else:
-            logger.error(f"Plugin '{plugin_name}': Failed to find/create menu '{menu_path}' for action.")
+            logger.error("Plugin '%s': Failed to find/create menu '%s' for action.", plugin_name, menu_path)
 
     def register_toolbar_widget(self, section_path: str, widget: QWidget):
         target_toolbar = self.tool_bar
         if not target_toolbar:
             logger.error("Toolbar not initialized.")
             return
-        widget_text = getattr(widget, 'text', type(widget).__name__)
-        widget_text = widget_text().replace('&', '') if callable(widget_text) else str(widget_text).replace('&', '')
-        logger.debug(f"Adding widget '{widget_text}' to toolbar (section '{section_path}')")
+        if logger.isEnabledFor(logging.DEBUG):
+            # The text is only needed for this message; skip the introspection and Qt calls otherwise
+            widget_text = getattr(widget, 'text', type(widget).__name__)
+            widget_text = _strip_amp(widget_text() if callable(widget_text) else str(widget_text))
+            logger.debug("Adding widget '%s' to toolbar (section '%s')", widget_text, section_path)
         if isinstance(widget, QAction):
             target_toolbar.addAction(widget)
         else:
             target_toolbar.addWidget(widget)
 
     def update_status(self, message: str, timeout: int = 0):
-        if self.status_bar:
-            if timeout > 0:
-                self.status_bar.showMessage(message, timeout)
-            else:
-                self.status_bar.showMessage(message)
-        else:
+        """
+        Shows a status bar message. Calls are coalesced: only the latest message
+        of a burst is painted, at most once per _STATUS_FLUSH_INTERVAL_MS.
+        """
+        if not self.status_bar:
             logger.warning("StatusBar not initialized.")
+            return
+        self._pending_status = (message, timeout)
+        if self._status_timer is None:
+            self._flush_status()
+        elif not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self):
+        """Shows the latest pending status message."""
+        pending = self._pending_status
+        self._pending_status = None
+        if pending is None or not self.status_bar:
+            return
+        message, timeout = pending
+        if timeout > 0:
+            self.status_bar.showMessage(message, timeout)
+        else:
+            self.status_bar.showMessage(message)
 
     def show_about_dialog(self):
         """Shows the 'About' dialog with profile and plugin information."""
@@ -227,21 +318,15 @@ class UIManager:
 
             plugin_manager: Optional['PluginManager'] = getattr(app_core, 'plugin_manager', None)
             loaded_plugins = plugin_manager.loaded_plugins if plugin_manager else {}
-            from .. import __version__ as lib_version
-        except (ImportError, AttributeError, NameError) as e:
-            logger.error(f"Error getting data for 'About': {e}")
-            lib_version = "N/A"
+        except (AttributeError, NameError) as e:
+            logger.error("Error getting data for 'About': %s", e)
             profile_title = "N/A"
             profile_author = "Unknown"
             profile_version = "N/A"
             loaded_plugins = {}
 
         about_text_lines = [
-            f"<b>just-gui Library</b>",
-            f"Version: {lib_version}",
-            f"© 2025 DIMNISSV. MIT License.",
-            f"<a href=\"https://github.com/DIMNISSV/just-gui\">GitHub</a>",
-            "<hr>",
+            _ABOUT_LIBRARY_HTML,
             f"<b>Profile: {profile_title}</b>",
             f"Version: {profile_version}",
             f"Author: {profile_author}",
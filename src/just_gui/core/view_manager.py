@@ -1,14 +1,17 @@
 # src/just_gui/core/view_manager.py
-import json
 import logging
-from functools import partial
-from typing import Dict, Optional, Tuple, TYPE_CHECKING
+import os
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple, TYPE_CHECKING
 
-from PySide6.QtCore import Slot, QObject
-from PySide6.QtGui import QAction, QIcon
-from PySide6.QtWidgets import QWidget, QTabWidget, QMessageBox
+from PySide6.QtCore import Slot, QObject, QRunnable, QThreadPool, QTimer
+from PySide6.QtGui import QAction
+from PySide6.QtWidgets import QWidget, QTabWidget, QMessageBox, QMenu
 
 from ..plugins.base import ViewFactory
+from .ui_manager import _theme_icon
 
 if TYPE_CHECKING:
     from .app import AppCore
@@ -17,6 +20,50 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Attribute set on every tab widget opened by ViewManager, holding its (plugin_name, view_id)
+_VIEW_KEY_ATTR = "_jg_view_key"
+
+
+@lru_cache(maxsize=None)
+def _json_codec() -> Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]:
+    """
+    Returns (dumps, loads) for the view state file, working on UTF-8 bytes.
+    Uses orjson when installed (the "speedups" extra), otherwise the standard json module.
+    Resolved on first use, so neither module is imported at startup.
+    """
+    try:
+        import orjson
+    except ImportError:
+        import json
+        return (lambda obj: json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')), json.loads
+    return (lambda obj: orjson.dumps(obj, option=orjson.OPT_INDENT_2)), orjson.loads
+
+
+def _write_view_state_file(state_file: Path, state_data: Dict):
+    """Writes the view state atomically: to a temporary file first, then os.replace() over the old one."""
+    dumps, _ = _json_codec()
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = state_file.with_suffix('.tmp')
+    with open(tmp_file, 'wb') as f:
+        f.write(dumps(state_data))
+    os.replace(tmp_file, state_file)
+
+
+class _ViewStateWriter(QRunnable):
+    """Writes an already collected view state on a QThreadPool thread (used on application close)."""
+
+    def __init__(self, state_file: Path, state_data: Dict):
+        super().__init__()
+        self._state_file = state_file
+        self._state_data = state_data
+
+    def run(self):
+        try:
+            _write_view_state_file(self._state_file, self._state_data)
+            logger.info("View saved (%s tabs).", len(self._state_data["open_tabs"]))
+        except Exception as e:
+            logger.error("Error writing view file %s: %s", self._state_file, e, exc_info=True)
+
 
 class ViewManager(QObject):
     """Manages view declarations, opening, and state (tabs)."""
@@ -28,10 +75,18 @@ class ViewManager(QObject):
         self.tab_widget: Optional[QTabWidget] = ui_manager.tab_widget
 
         self._declared_views: Dict[str, Dict[str, Tuple[str, ViewFactory]]] = {}
-        self._open_view_widgets: Dict[QWidget, Tuple[str, str]] = {}
+        # How many tabs are open per (plugin_name, view_id), for O(1) "already open" checks
+        self._open_view_counts: Counter = Counter()
+        # Placeholder widgets of tabs whose view has not been created yet (see _materialize_tab)
+        self._lazy_tabs: Set[QWidget] = set()
+        # Static part of the 'View' menu, created once by _add_menu_actions; plugin submenus go above the separator
+        self._view_separator: Optional[QAction] = None
+        self._reset_view_action: Optional[QAction] = None
+        self._view_menu_update_pending = False
 
         if self.tab_widget:
             self.tab_widget.tabCloseRequested.connect(self._handle_tab_close_request)
+            self.tab_widget.currentChanged.connect(self._handle_current_tab_changed)
         else:
             logger.error("ViewManager: TabWidget was not provided by UIManager!")
 
@@ -41,7 +96,7 @@ class ViewManager(QObject):
         """Adds static actions to the 'File' and 'View' menus."""
         file_menu = self.ui_manager.find_or_create_menu("File")
         if file_menu and not any(a.text() == "Сохранить &View" for a in file_menu.actions()):
-            save_view_action = QAction(QIcon.fromTheme("document-save"), "Save &View", self.app_core)
+            save_view_action = QAction(_theme_icon("document-save"), "Save &View", self.app_core)
             save_view_action.triggered.connect(self.save_view_state)
             target_action = next((act for act in reversed(file_menu.actions()) if not act.isSeparator()), None)
             if target_action:
@@ -52,48 +107,62 @@ class ViewManager(QObject):
                 file_menu.addAction(save_view_action)
 
         view_menu = self.ui_manager.find_or_create_menu("View")
-        if view_menu and not any(a.text() == "&Reset View" for a in view_menu.actions()):
-            separator = next((act for act in view_menu.actions() if act.isSeparator()),
-                             None) or view_menu.addSeparator()
-            reset_view_action = QAction(QIcon.fromTheme("view-refresh"), "&Reset View", self.app_core)
-            reset_view_action.triggered.connect(self.reset_view_state)
-            view_menu.addAction(reset_view_action)
+        if view_menu and self._view_separator is None:
+            self._view_separator = view_menu.addSeparator()
+            self._reset_view_action = QAction(_theme_icon("view-refresh"), "&Reset View", self.app_core)
+            self._reset_view_action.triggered.connect(self.reset_view_state)
+            view_menu.addAction(self._reset_view_action)
 
     def declare_view(self, plugin_name: str, view_id: str, name: str, factory: ViewFactory):
 
         if plugin_name not in self._declared_views: self._declared_views[plugin_name] = {}
         if view_id in self._declared_views[plugin_name]: logger.warning(
-            f"Plugin '{plugin_name}' re-declares '{view_id}'.")
+            "Plugin '%s' re-declares '%s'.", plugin_name, view_id)
         self._declared_views[plugin_name][view_id] = (name, factory)
+        self.schedule_view_menu_update()
+
+    def schedule_view_menu_update(self):
+        """
+        Requests a 'View' menu rebuild on the next event loop iteration.
+        A burst of requests (e.g. a plugin declaring many views) results in a single rebuild.
+        """
+        if self._view_menu_update_pending:
+            return
+        self._view_menu_update_pending = True
+        QTimer.singleShot(0, self._flush_view_menu_update)
+
+    def _flush_view_menu_update(self):
+        # Already done if update_view_menu() was called directly in the meantime
+        if self._view_menu_update_pending:
+            self.update_view_menu()
 
     def update_view_menu(self):
         """Updates the 'View' menu, using plugin.title for submenus."""
+        self._view_menu_update_pending = False
         view_menu = self.ui_manager.get_view_menu()
         if not view_menu: logger.error("'View' menu not found!"); return
         logger.debug("ViewManager: Updating 'View' menu...")
 
-        separator = next((act for act in view_menu.actions() if act.isSeparator()), None)
-        if separator is None: logger.error("Separator in 'View' menu not found!"); return
-
-        actions_to_remove = [act for act in view_menu.actions() if act != separator and act.text() != "&Сбросить вид"]
-        dynamic_actions = []
-        current_action = view_menu.actions()[0] if view_menu.actions() else None
-        while current_action and current_action != separator:
-            dynamic_actions.append(current_action)
-            # More reliable way - get list and find next by index
-            all_actions = view_menu.actions()
-            try:
-                idx = all_actions.index(current_action)
-                if idx + 1 < len(all_actions):
-                    current_action = all_actions[idx + 1]
-                else:
-                    current_action = None
-            except ValueError:
-                current_action = None
-
-        for action in dynamic_actions:
+        # The rebuild removes and inserts many actions; relayout and repaint the menu once at the end
+        view_menu.setUpdatesEnabled(False)
+        view_menu.blockSignals(True)
+        try:
+            self._rebuild_view_menu(view_menu)
+        finally:
+            view_menu.blockSignals(False)
+            view_menu.setUpdatesEnabled(True)
+
+    def _rebuild_view_menu(self, view_menu: QMenu):
+        """Replaces the dynamic (per-plugin) part of the 'View' menu, above the separator."""
+        separator = self._view_separator
+        if separator is None: logger.error("'View' menu separator was not created!"); return
+
+        # Everything above the persistent separator is dynamic; the separator and 'Reset View' are never touched
+        all_actions = view_menu.actions()
+        for action in all_actions[:all_actions.index(separator)]:
             view_menu.removeAction(action)
-            action.deleteLater()
+            if action.menu() is None:  # plugin submenus are cached by UIManager and reused below
+                action.deleteLater()
 
         added_items = False
         actions_to_insert = []
@@ -111,53 +180,59 @@ class ViewManager(QObject):
             plugin_display_name = plugin.title  # Use title
             plugin_menu_path = f"View/{plugin_display_name}"  # Path with display name
 
-            submenu = self.ui_manager.find_or_create_menu(plugin_menu_path)
-            if not submenu: logger.error(f"Failed to create submenu '{plugin_display_name}' in 'View'."); continue
+            submenu = self.ui_manager.clear_menu(plugin_menu_path)
+            if not submenu: logger.error("Failed to create submenu '%s' in 'View'.", plugin_display_name); continue
 
-            submenu_action = submenu.menuAction()
-            # Check if the submenu action needs to be added (if it's not already before the separator)
+            actions_to_insert.append(submenu.menuAction())
 
-            if submenu_action and not any(
-                    a == submenu_action for a in view_menu.actions() if
-                    a != separator and a.text() != "&Restore view"):
-                actions_to_insert.append(submenu_action)
-
-            submenu.clear()
             sorted_view_ids = sorted(plugin_views.keys())
             for view_id in sorted_view_ids:
                 view_name, _ = plugin_views[view_id]
                 action = QAction(view_name, self.app_core)
-                action.triggered.connect(partial(self.open_view_by_id, plugin_name, view_id))
+                action.setData([plugin_name, view_id])
+                action.triggered.connect(self._on_view_action_triggered)
                 submenu.addAction(action)
                 added_items = True
 
         if actions_to_insert:
-            for action_to_insert in reversed(actions_to_insert): view_menu.insertAction(separator, action_to_insert)
-        # Check if only static elements remain
-        elif not any(not a.isSeparator() and not a.text().endswith("Reset View") for a in view_menu.actions()):
+            for action_to_insert in actions_to_insert: view_menu.insertAction(separator, action_to_insert)
+        else:
             no_views_action = QAction("No views available", self.app_core);
             no_views_action.setEnabled(False)
             view_menu.insertAction(separator, no_views_action)
 
         logger.debug("ViewManager: 'View' menu updated.")
 
-    @Slot(str, str)
-    def open_view_by_id(self, plugin_name: str, view_id: str):
+    @Slot()
+    def _on_view_action_triggered(self):
+        """Single slot for all 'View' menu actions; the view to open is stored in QAction.data()."""
+        action = self.sender()
+        if isinstance(action, QAction):
+            plugin_name, view_id = action.data()
+            self.open_view_by_id(plugin_name, view_id)
 
+    @Slot(str, str)
+    def open_view_by_id(self, plugin_name: str, view_id: str, lazy: bool = False):
+        """
+        Opens a declared view in a new tab.
+        If `lazy` is True, only a placeholder tab is added and the view factory
+        is called when the tab is first shown (the tab is not made current).
+        """
         if not self.tab_widget:
             logger.error("TabWidget not initialized!")
             return
-        logger.info(f"Request to open: plugin='{plugin_name}', view_id='{view_id}'")
+        logger.info("Request to open: plugin='%s', view_id='%s'", plugin_name, view_id)
         try:
             view_name, factory = self._declared_views[plugin_name][view_id]
-            logger.debug(f"Calling factory for '{view_name}'...")
-            widget = factory()
-            if not isinstance(widget, QWidget): raise TypeError("Factory must return QWidget")
-            index = self.tab_widget.addTab(widget, view_name)
-            self.tab_widget.setTabToolTip(index, f"{view_name} (Plugin: {plugin_name})")
-            self.tab_widget.setCurrentIndex(index)
-            self._open_view_widgets[widget] = (plugin_name, view_id)
-            logger.info(f"View '{view_name}' opened.")
+            if lazy:
+                self._add_lazy_tab(plugin_name, view_id, view_name)
+            else:
+                logger.debug("Calling factory for '%s'...", view_name)
+                widget = factory()
+                if not isinstance(widget, QWidget): raise TypeError("Factory must return QWidget")
+                index = self._add_view_tab(plugin_name, view_id, view_name, widget)
+                self.tab_widget.setCurrentIndex(index)
+            logger.info("View '%s' opened%s.", view_name, ' (deferred)' if lazy else '')
         except KeyError:
             msg = f"Declared view not found: plugin='{plugin_name}', view_id='{view_id}'"
             logger.error(
@@ -170,24 +245,103 @@ class ViewManager(QObject):
             QMessageBox.critical(
                 self.app_core, "Critical Error", msg)
 
+    def _add_view_tab(self, plugin_name: str, view_id: str, view_name: str, widget: QWidget) -> int:
+        """Appends a tab for a view widget and tracks it. Returns the tab index."""
+        assert self.tab_widget is not None
+        index = self.tab_widget.addTab(widget, view_name)
+        self.tab_widget.setTabToolTip(index, f"{view_name} (Plugin: {plugin_name})")
+        self._track_view(widget, (plugin_name, view_id))
+        return index
+
+    def _add_lazy_tab(self, plugin_name: str, view_id: str, view_name: str) -> int:
+        """Appends a placeholder tab whose view is created on first activation (see _materialize_tab)."""
+        widget = QWidget()
+        self._lazy_tabs.add(widget)
+        return self._add_view_tab(plugin_name, view_id, view_name, widget)
+
+    def _track_view(self, widget: QWidget, view_key: Tuple[str, str]):
+        setattr(widget, _VIEW_KEY_ATTR, view_key)
+        self._open_view_counts[view_key] += 1
+
+    def _untrack_view(self, widget: QWidget) -> Optional[Tuple[str, str]]:
+        view_key = getattr(widget, _VIEW_KEY_ATTR, None)
+        if view_key is not None:
+            setattr(widget, _VIEW_KEY_ATTR, None)
+            self._open_view_counts[view_key] -= 1
+            if self._open_view_counts[view_key] <= 0:
+                del self._open_view_counts[view_key]
+        return view_key
+
+    def _declared_view_name(self, view_key: Optional[Tuple[str, str]]) -> str:
+        """Returns the declared display name of a tracked view, or '?' for untracked widgets."""
+        if view_key is None:
+            return "?"
+        plugin_name, view_id = view_key
+        declared = self._declared_views.get(plugin_name, {}).get(view_id)
+        return declared[0] if declared else view_id
+
+    @Slot(int)
+    def _handle_current_tab_changed(self, index: int):
+        if index >= 0 and self.tab_widget and self.tab_widget.widget(index) in self._lazy_tabs:
+            self._materialize_tab(index)
+
+    def _materialize_tab(self, index: int):
+        """Replaces the placeholder at `index` with the widget created by the view factory."""
+        assert self.tab_widget is not None
+        placeholder = self.tab_widget.widget(index)
+        plugin_name, view_id = self._untrack_view(placeholder)
+        self._lazy_tabs.discard(placeholder)
+        tool_tip = self.tab_widget.tabToolTip(index)
+
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            view_name, factory = self._declared_views[plugin_name][view_id]
+            logger.debug("Calling factory for deferred view '%s'...", view_name)
+            widget = factory()
+            if not isinstance(widget, QWidget): raise TypeError("Factory must return QWidget")
+            self.tab_widget.insertTab(index, widget, view_name)
+            self.tab_widget.setTabToolTip(index, tool_tip)
+            self.tab_widget.setCurrentIndex(index)
+            self._track_view(widget, (plugin_name, view_id))
+            logger.info("View '%s' created.", view_name)
+        except Exception as e:
+            msg = f"Error opening '{plugin_name}/{view_id}': {e}"
+            logger.error(msg, exc_info=True)
+            QMessageBox.critical(self.app_core, "Critical Error", msg)
+        finally:
+            self.tab_widget.blockSignals(False)
+            placeholder.deleteLater()
+        # The failed tab is gone, so another (possibly deferred) tab may have become current
+        self._ensure_current_tab_materialized()
+
+    def _ensure_current_tab_materialized(self):
+        if self.tab_widget:
+            self._handle_current_tab_changed(self.tab_widget.currentIndex())
+
     def open_all_declared_views(self):
-        """Opens all declared views by default."""
+        """Opens all declared views by default (only the current tab is created right away)."""
         logger.debug("Opening all declared views...")
         opened_count = 0
-        for plugin_name, views in self._declared_views.items():
-            for view_id, (view_name, factory) in views.items():
-                # Check if the tab is already open (just in case)
-                is_open = any(p == plugin_name and v == view_id for p, v in self._open_view_widgets.values())
-                if not is_open:
-                    logger.debug(f"Opening default view: {plugin_name}/{view_id}")
-                    self.open_view_by_id(plugin_name, view_id)
-                    opened_count += 1
-                else:
-                    logger.debug(f"View {plugin_name}/{view_id} was already open, skipping.")
-        logger.info(f"Default views opened: {opened_count}")
-        # Can set the first tab active if they were opened
-        if self.tab_widget and self.tab_widget.count() > 0:
-            self.tab_widget.setCurrentIndex(0)
+        if self.tab_widget: self.tab_widget.blockSignals(True)
+        try:
+            for plugin_name, views in self._declared_views.items():
+                for view_id, (view_name, factory) in views.items():
+                    # Check if the tab is already open (just in case)
+                    is_open = self._open_view_counts[(plugin_name, view_id)] > 0
+                    if not is_open:
+                        logger.debug("Opening default view: %s/%s", plugin_name, view_id)
+                        self.open_view_by_id(plugin_name, view_id, lazy=True)
+                        opened_count += 1
+                    else:
+                        logger.debug("View %s/%s was already open, skipping.", plugin_name, view_id)
+            # Can set the first tab active if they were opened
+            if self.tab_widget and self.tab_widget.count() > 0:
+                self.tab_widget.setCurrentIndex(0)
+        finally:
+            if self.tab_widget: self.tab_widget.blockSignals(False)
+        logger.info("Default views opened: %s", opened_count)
+        self._ensure_current_tab_materialized()
 
     @Slot(int)
     def _handle_tab_close_request(self, index: int):
@@ -195,107 +349,178 @@ class ViewManager(QObject):
         if not self.tab_widget: return
         widget = self.tab_widget.widget(index)
         if widget:
-            tab_name = self.tab_widget.tabText(index)
-            logger.debug(f"Tab close request for '{tab_name}'")
-            unsubscribe_callback = widget.property("unsubscribe_callback")
-            if callable(unsubscribe_callback):
-                try:
-                    logger.debug(f"Calling unsubscribe for '{tab_name}'...")
-                    unsubscribe_callback()
-                except Exception as e:
-                    logger.error(f"Unsubscribe error for '{tab_name}': {e}", exc_info=True)
             self.tab_widget.removeTab(index)
-            if widget in self._open_view_widgets:
-                plugin_name, view_id = self._open_view_widgets.pop(widget)
-                logger.info(f"Tab '{tab_name}' ({plugin_name}/{view_id}) closed.")
-            widget.deleteLater()
+            self._dispose_tab_widget(widget)
+
+    def _dispose_tab_widget(self, widget: QWidget):
+        """Releases a widget that has been removed from the tab widget: unsubscribes, untracks and deletes it."""
+        # The name comes from our own bookkeeping, not from a tabText() round-trip into Qt
+        view_key = self._untrack_view(widget)
+        tab_name = self._declared_view_name(view_key)
+        logger.debug("Tab close request for '%s'", tab_name)
+        unsubscribe_callback = widget.property("unsubscribe_callback")
+        if callable(unsubscribe_callback):
+            try:
+                logger.debug("Calling unsubscribe for '%s'...", tab_name)
+                unsubscribe_callback()
+            except Exception as e:
+                logger.error("Unsubscribe error for '%s': %s", tab_name, e, exc_info=True)
+        self._lazy_tabs.discard(widget)
+        if view_key:
+            plugin_name, view_id = view_key
+            logger.info("Tab '%s' (%s/%s) closed.", tab_name, plugin_name, view_id)
+        widget.deleteLater()
 
     def close_all_tabs(self, force=False):
 
         if not self.tab_widget: return
-        logger.debug(f"Closing all tabs (force={force})")
-        while self.tab_widget.count() > 0: self._handle_tab_close_request(0)
-        if self._open_view_widgets:
-            logger.warning(f"_open_view_widgets is not empty: {self._open_view_widgets}")
-            self._open_view_widgets.clear()
+        logger.debug("Closing all tabs (force=%s)", force)
+        widgets = [self.tab_widget.widget(i) for i in range(self.tab_widget.count())]
+        # All tabs are removed with one clear() instead of N removeTab(0) calls that each shift the rest;
+        # signals are blocked so that closing does not create deferred views that are about to be closed too
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.clear()
+        finally:
+            self.tab_widget.blockSignals(False)
+        for widget in widgets:
+            self._dispose_tab_widget(widget)
+        self._open_view_counts.clear()
         logger.info("All tabs closed.")
 
+    @staticmethod
+    def read_view_state(state_file: Path) -> Optional[Dict]:
+        """
+        Reads the saved view state. Does not touch Qt, so it can run in a worker thread.
+        Returns None if there is no saved state; raises on read/parse errors.
+        """
+        _, loads = _json_codec()
+        try:
+            f = open(state_file, 'rb')
+        except FileNotFoundError:
+            logger.info("View state file not found (%s).", state_file)
+            return None
+        logger.info("Loading view state from: %s", state_file)
+        with f:
+            return loads(f.read())
+
     def load_view_state(self) -> bool:
         """Loads the view state from a file. Returns True if the view was successfully loaded and is not empty."""
         if not self.tab_widget: return False
         state_file = self.app_core.view_state_file
-        if not state_file.exists():
-            logger.info(f"View state file not found ({state_file}).")
+        try:
+            state_data = self.read_view_state(state_file)
+        except Exception as e:
+            self.report_view_state_error(state_file, e)
             return False
+        return self.apply_view_state(state_data)
 
-        logger.info(f"Loading view state from: {state_file}")
+    def apply_view_state(self, state_data: Optional[Dict]) -> bool:
+        """Restores tabs from already read view state. Returns True if the view was restored and is not empty."""
+        if not self.tab_widget or state_data is None: return False
         try:
-            with open(state_file, 'r', encoding='utf-8') as f:
-                state_data = json.load(f)
             open_tabs_info = state_data.get("open_tabs", [])
             if not open_tabs_info:
                 logger.info("Saved view is empty.")
                 return False  # Consider the view not loaded if it is empty
 
-            logger.debug(f"Restoring tabs: {open_tabs_info}")
-            self.close_all_tabs(force=True)
-            opened_count = 0
+            logger.debug("Restoring tabs: %s", open_tabs_info)
+            # Resolve every saved tab against the declared views first, so the creation loop below
+            # does no lookups and has nothing left to fail on
+            tabs_to_open = []
             for tab_info in open_tabs_info:
                 p_name, v_id = tab_info.get("plugin"), tab_info.get("view_id")
-                if p_name and v_id and p_name in self._declared_views and v_id in self._declared_views[p_name]:
-                    self.open_view_by_id(p_name, v_id)
-                    opened_count += 1
+                declared = self._declared_views.get(p_name, {}).get(v_id) if p_name and v_id else None
+                if declared is not None:
+                    tabs_to_open.append((p_name, v_id, declared[0]))
                 else:
-                    logger.warning(f"Saved '{p_name}/{v_id}' not found.")
-
-            idx = state_data.get("current_index", -1)
-            if 0 <= idx < self.tab_widget.count():
-                self.tab_widget.setCurrentIndex(idx)
-            elif self.tab_widget.count() > 0:
-                self.tab_widget.setCurrentIndex(0)
+                    logger.warning("Saved '%s/%s' not found.", p_name, v_id)
 
-            logger.info(f"View loaded ({opened_count} tabs).")
+            self.close_all_tabs(force=True)
+            tab_bar = self.tab_widget.tabBar()
+            # Restore the previous state rather than forcing True: callers may have suspended updates themselves
+            tabs_updates_enabled, bar_updates_enabled = self.tab_widget.updatesEnabled(), tab_bar.updatesEnabled()
+            self.tab_widget.setUpdatesEnabled(False)
+            tab_bar.setUpdatesEnabled(False)
+            self.tab_widget.blockSignals(True)
+            try:
+                for p_name, v_id, view_name in tabs_to_open:
+                    self._add_lazy_tab(p_name, v_id, view_name)
+
+                idx = state_data.get("current_index", -1)
+                if not 0 <= idx < self.tab_widget.count():
+                    idx = 0
+                if self.tab_widget.count() > 0:
+                    self.tab_widget.setCurrentIndex(idx)
+            finally:
+                self.tab_widget.blockSignals(False)
+                tab_bar.setUpdatesEnabled(bar_updates_enabled)
+                self.tab_widget.setUpdatesEnabled(tabs_updates_enabled)
+            self._ensure_current_tab_materialized()
+
+            logger.info("View loaded (%s tabs).", len(tabs_to_open))
             return True  # View successfully loaded and is not empty
         except Exception as e:
-            msg = f"Error loading or applying view state from {state_file}: {e}"
-            logger.error(msg, exc_info=True)
-            QMessageBox.warning(self.app_core, "View Loading Error", f"{msg}\nDefault view will be used.")
-            self.close_all_tabs(force=True)
+            self.report_view_state_error(self.app_core.view_state_file, e)
             return False  # Failed to load
 
+    def report_view_state_error(self, state_file: Path, error: Exception):
+        """Logs and shows a view state loading error and falls back to an empty view."""
+        msg = f"Error loading or applying view state from {state_file}: {error}"
+        logger.error(msg, exc_info=error)
+        QMessageBox.warning(self.app_core, "View Loading Error", f"{msg}\nDefault view will be used.")
+        self.close_all_tabs(force=True)
+
+    def _collect_view_state(self) -> Optional[Dict]:
+        """Builds the view state from the open tabs. Reads Qt widgets, so it must run on the GUI thread."""
+        if not self.tab_widget:
+            logger.error("Cannot save view: TabWidget does not exist.")
+            return None
+        open_tabs_info = []
+        for i in range(self.tab_widget.count()):
+            widget = self.tab_widget.widget(i)
+            view_key = getattr(widget, _VIEW_KEY_ATTR, None)
+            if view_key is not None:
+                p_name, v_id = view_key
+                open_tabs_info.append({"plugin": p_name, "view_id": v_id})
+        return {"open_tabs": open_tabs_info, "current_index": self.tab_widget.currentIndex()}
+
     @Slot()
     def save_view_state(self):
-
+        """Saves the view state synchronously and reports errors to the user ('Save View' action)."""
         state_file = self.app_core.view_state_file
-        logger.info(f"Saving view to: {state_file}")
-        open_tabs_info = []
-        if self.tab_widget:
-            for i in range(self.tab_widget.count()):
-                widget = self.tab_widget.widget(i)
-                if widget in self._open_view_widgets:
-                    p_name, v_id = self._open_view_widgets[widget]
-                    open_tabs_info.append({"plugin": p_name, "view_id": v_id})
-            state_data = {"open_tabs": open_tabs_info, "current_index": self.tab_widget.currentIndex()}
-            try:
-                state_file.parent.mkdir(parents=True, exist_ok=True)
-                with open(state_file, 'w', encoding='utf-8') as f:
-                    json.dump(state_data, f, indent=2, ensure_ascii=False)
-                logger.info(f"View saved ({len(open_tabs_info)} tabs).")
-                self.ui_manager.update_status("View saved.", 3000)
-            except IOError as e:
-                msg = f"Error writing view file {state_file}: {e}"
-                logger.error(msg,
-                             exc_info=True)
-                QMessageBox.critical(
-                    self.app_core, "View Saving Error", msg)
-            except Exception as e:
-                msg = f"Unexpected error saving view: {e}"
-                logger.error(msg,
-                             exc_info=True)
-                QMessageBox.critical(
-                    self.app_core, "View Saving Error", msg)
-        else:
-            logger.error("Cannot save view: TabWidget does not exist.")
+        logger.info("Saving view to: %s", state_file)
+        state_data = self._collect_view_state()
+        if state_data is None:
+            return
+        try:
+            _write_view_state_file(state_file, state_data)
+            logger.info("View saved (%s tabs).", len(state_data["open_tabs"]))
+            self.ui_manager.update_status("View saved.", 3000)
+        except IOError as e:
+            msg = f"Error writing view file {state_file}: {e}"
+            logger.error(msg,
+                         exc_info=True)
+            QMessageBox.critical(
+                self.app_core, "View Saving Error", msg)
+        except Exception as e:
+            msg = f"Unexpected error saving view: {e}"
+            logger.error(msg,
+                         exc_info=True)
+            QMessageBox.critical(
+                self.app_core, "View Saving Error", msg)
+
+    def save_view_state_in_background(self):
+        """
+        Collects the view state on the GUI thread and writes it on QThreadPool.globalInstance(),
+        so closing the window does not wait for disk I/O. Errors are only logged.
+        Callers that must be sure the file is written wait with QThreadPool.waitForDone().
+        """
+        state_file = self.app_core.view_state_file
+        logger.info("Saving view to: %s", state_file)
+        state_data = self._collect_view_state()
+        if state_data is not None:
+            QThreadPool.globalInstance().start(_ViewStateWriter(state_file, state_data))
 
     @Slot()
     def reset_view_state(self):
@@ -311,7 +536,7 @@ class ViewManager(QObject):
             try:
                 if state_file.exists():
                     state_file.unlink()
-                    logger.info(f"View file deleted: {state_file}")
+                    logger.info("View file deleted: %s", state_file)
             except OSError as e:
                 msg = f"Failed to delete saved view file {state_file}: {e}"
                 logger.error(msg, exc_info=True)
@@ -2,12 +2,13 @@
 import asyncio
 import logging
 from collections import defaultdict
-from typing import Callable, Any, Dict, List, Coroutine, Union
+from typing import Callable, Any, Dict, List, Coroutine, Union, Optional, Set, Tuple
 import fnmatch
 
 logger = logging.getLogger(__name__)
 
-HandlerType = Union[Callable[[Dict[str, Any]], None], Callable[[Dict[str, Any]], Coroutine[Any, Any, None]]]
+# Event payloads are usually dicts, but any object (e.g. a slotted dataclass) can be published
+HandlerType = Union[Callable[[Any], None], Callable[[Any], Coroutine[Any, Any, None]]]
 
 
 class EventBus:
@@ -19,12 +20,24 @@ class EventBus:
     def __init__(self):
         self._subscribers: Dict[str, List[HandlerType]] = defaultdict(list)
         self._wildcard_subscribers: Dict[str, List[HandlerType]] = defaultdict(list)
+        # Async handlers of publish_nowait() are started in publish order by one long-lived dispatcher task;
+        # each runs in its own task (kept here until done), so a slow handler does not hold back the others
+        self._dispatch_queue: Optional[asyncio.Queue] = None
+        self._dispatcher_task: Optional[asyncio.Task] = None
+        self._handler_tasks: Set[asyncio.Task] = set()
+        # topic -> latest data posted via post() and not delivered yet
+        self._outbox: Dict[str, Any] = {}
+        self._outbox_scheduled = False
+        # topic -> handlers resolved for it (exact + wildcard); reset on any (un)subscription.
+        # Topics without handlers are not stored, so dynamic topic names cannot grow it without bound
+        self._handler_cache: Dict[str, Tuple[HandlerType, ...]] = {}
 
     def subscribe(self, topic: str, handler: HandlerType):
         """
         Subscribes a handler to the specified topic.
         The topic can contain '*' at the end for wildcard subscription (e.g., "file.*").
         """
+        self._handler_cache.clear()
         if topic.endswith('*'):
             pattern = topic[:-1]
             self._wildcard_subscribers[pattern].append(handler)
@@ -35,6 +48,7 @@ class EventBus:
 
     def unsubscribe(self, topic: str, handler: HandlerType):
         """Unsubscribes a handler from a topic."""
+        self._handler_cache.clear()
         if topic.endswith('*'):
             pattern = topic[:-1]
             if pattern in self._wildcard_subscribers:
@@ -55,20 +69,15 @@ class EventBus:
                 except ValueError:
                     logger.warning(f"Handler {handler.__name__} not found for topic '{topic}'")
 
-    async def publish(self, topic: str, data: Dict[str, Any]):
+    async def publish(self, topic: str, data: Any):
         """
         Publishes an event asynchronously.
         Notifies all subscribers for the exact topic and matching wildcard topics.
         """
-        logger.debug(f"Publishing event on topic '{topic}': {data}")
-        handlers_to_call: List[HandlerType] = []
-
-        if topic in self._subscribers:
-            handlers_to_call.extend(self._subscribers[topic])
-
-        for pattern, handlers in self._wildcard_subscribers.items():
-            if topic.startswith(pattern):
-                handlers_to_call.extend(handlers)
+        handlers_to_call = self._collect_handlers(topic)
+        if not handlers_to_call:
+            return
+        logger.debug("Publishing event on topic '%s': %s", topic, data)
 
         tasks = []
         for handler in handlers_to_call:
@@ -86,3 +95,115 @@ class EventBus:
         if tasks:
             await asyncio.gather(*tasks,
                                  return_exceptions=True)
+
+    def publish_nowait(self, topic: str, data: Any):
+        """
+        Publishes an event without awaiting it (for use from synchronous code, e.g. Qt slots).
+        Sync handlers are called immediately; async handlers are queued and started in order
+        by a dispatcher task on the running event loop, each in its own task, without waiting for their completion.
+        Async handlers need a running event loop: without one they are not called and an error is logged.
+        """
+        handlers_to_call = self._collect_handlers(topic)
+        if not handlers_to_call:
+            return
+        logger.debug("Publishing event (nowait) on topic '%s': %s", topic, data)
+        for handler in handlers_to_call:
+            try:
+                if asyncio.iscoroutinefunction(handler):
+                    self._get_dispatch_queue().put_nowait((handler, topic, data))
+                else:
+                    handler(data)
+            except Exception as e:
+                logger.error(f"Error executing handler {handler.__name__} for topic '{topic}': {e}", exc_info=True)
+
+    def post(self, topic: str, data: Any):
+        """
+        Publishes an event on the next event loop iteration, coalescing bursts:
+        if the same topic is posted several times before delivery, only the latest
+        data is published. Use it for "current value" events where intermediate
+        values do not matter.
+
+        Raises:
+            RuntimeError: If no event loop is running (there is no next iteration to deliver on).
+        """
+        loop = asyncio.get_running_loop()
+        if not self._collect_handlers(topic):
+            return
+        self._outbox[topic] = data
+        if self._outbox_scheduled:
+            return
+        self._outbox_scheduled = True
+        loop.call_soon(self._flush_outbox)
+
+    def _flush_outbox(self):
+        self._outbox_scheduled = False
+        outbox, self._outbox = self._outbox, {}
+        for topic, data in outbox.items():
+            self.publish_nowait(topic, data)
+
+    def _collect_handlers(self, topic: str) -> Tuple[HandlerType, ...]:
+        """
+        Returns the handlers for the exact topic and all matching wildcard patterns.
+        A non-empty result is cached per topic, so wildcard patterns are only scanned
+        once per topic until the subscriptions change.
+        """
+        cached = self._handler_cache.get(topic)
+        if cached is not None:
+            return cached
+
+        handlers_to_call: List[HandlerType] = []
+
+        if topic in self._subscribers:
+            handlers_to_call.extend(self._subscribers[topic])
+
+        for pattern, handlers in self._wildcard_subscribers.items():
+            if topic.startswith(pattern):
+                handlers_to_call.extend(handlers)
+
+        resolved = tuple(handlers_to_call)
+        if resolved:
+            self._handler_cache[topic] = resolved
+        return resolved
+
+    def _get_dispatch_queue(self) -> asyncio.Queue:
+        """
+        Returns the queue of the dispatcher task running on the current event loop,
+        (re)starting the task if there is none, it has finished or it belongs to another loop.
+        Raises RuntimeError if no event loop is running.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._dispatcher_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            # A dispatcher left on another (stopped or closed) loop would never run again; it is replaced
+            self._dispatch_queue = asyncio.Queue()
+            self._dispatcher_task = loop.create_task(self._dispatch_loop(self._dispatch_queue))
+        assert self._dispatch_queue is not None
+        return self._dispatch_queue
+
+    async def _dispatch_loop(self, queue: asyncio.Queue):
+        loop = asyncio.get_running_loop()
+        while True:
+            handler, topic, data = await queue.get()
+            task = loop.create_task(self._run_async_handler(handler, topic, data))
+            self._handler_tasks.add(task)
+            task.add_done_callback(self._handler_tasks.discard)
+            queue.task_done()
+
+    def shutdown(self):
+        """Stops the dispatcher task and cancels running async handlers; queued handler calls are dropped."""
+        if self._dispatcher_task is not None and not self._dispatcher_task.done():
+            self._dispatcher_task.cancel()
+            logger.debug("EventBus dispatcher task stopped.")
+        for task in list(self._handler_tasks):
+            task.cancel()
+        self._handler_tasks.clear()
+        self._dispatcher_task = None
+        self._dispatch_queue = None
+        self._outbox.clear()
+
+    @staticmethod
+    async def _run_async_handler(handler: HandlerType, topic: str, data: Any):
+        try:
+            await handler(data)
+        except Exception as e:
+            logger.error(f"Error executing handler {handler.__name__} for topic '{topic}': {e}", exc_info=True)
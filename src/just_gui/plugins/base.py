@@ -1,8 +1,9 @@
 # src/just_gui/plugins/base.py
 import logging
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, Optional, Callable
+from typing import TYPE_CHECKING, Any, Dict, Optional, Callable, Iterator
 
 from PySide6.QtWidgets import QWidget
 
@@ -113,6 +114,21 @@ class BasePlugin(ABC):
         logger.debug(f"Plugin '{self.name}': on_unload() called")
         pass
 
+    @contextmanager
+    def bulk_register(self) -> Iterator[None]:
+        """
+        Context manager for registering several views, menu actions and toolbar widgets at once.
+        Main window updates are suspended until the block exits, so the UI is laid out
+        and repainted once instead of after every registration.
+
+        Example:
+            with self.bulk_register():
+                self.declare_view(...)
+                self.register_menu_action(...)
+        """
+        with self._app.suspend_ui_updates():
+            yield
+
     def declare_view(self, view_id: str, name: str, factory: ViewFactory):
         """
         Declares a view (widget) that can be opened by the user
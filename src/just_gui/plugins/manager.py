@@ -36,14 +36,21 @@ class PluginManager:
     def loaded_plugins(self) -> Dict[str, BasePlugin]:
         return self._plugins.copy()
 
-    async def load_profile(self, profile_path: str):
+    async def load_profile(self, profile_path: str, profile_data: Optional[Dict] = None):
+        """
+        Loads the plugins listed in the profile.
+        `profile_data` is the already parsed profile, if the caller has it; otherwise the file is read here.
+        """
         logger.info(f"Loading profile: {profile_path}")
         profile_p = Path(profile_path)
-        try:
-            profile_data = load_toml(profile_p)
-        except (FileNotFoundError, ConfigError) as e:
-            logger.error(f"Failed to load profile: {e}", exc_info=True)
-            return
+        # Parsed TOML files are cached across runs; resolved here, on the GUI thread, before any worker uses it
+        cache_dir = self._app_core.cache_dir
+        if profile_data is None:
+            try:
+                profile_data = load_toml(profile_p, cache_dir=cache_dir)
+            except (FileNotFoundError, ConfigError) as e:
+                logger.error(f"Failed to load profile: {e}", exc_info=True)
+                return
 
         self._plugin_configs = profile_data.get("plugin_configs", {})
         plugins_section = profile_data.get("plugins", {})
@@ -53,29 +60,41 @@ class PluginManager:
         plugin_metadata_map: Dict[str, Dict] = {}
         profile_dir = profile_p.parent
 
+        local_plugin_dirs: List[Path] = []
         for local_path_str in plugins_section.get("local", []):
             local_path = Path(local_path_str)
             if not local_path.is_absolute(): local_path = (profile_dir / local_path).resolve()
             if local_path.is_dir():
                 logger.info(f"Discovered local plugin: {local_path}")
-                try:
-                    meta = self._read_plugin_metadata(local_path)
-                    if meta:
-                        plugin_name = meta['name']
-                        if plugin_name not in plugin_metadata_map:
-                            plugin_metadata_map[plugin_name] = meta
-                            plugin_load_queue.append((plugin_name, local_path, meta))
-                        else:
-                            logger.warning(f"Duplicate plugin '{plugin_name}' found at {local_path}.")
-                except (PluginLoadError, ConfigError) as e:
-                    logger.error(f"Metadata error at {local_path}: {e}")
+                local_plugin_dirs.append(local_path)
             else:
                 logger.warning(f"Not a directory: {local_path}")
 
+        # plugin.toml files are independent of each other, so read them concurrently in worker threads.
+        # Importing and on_load() stay sequential on the GUI thread (they create Qt objects, and order matters).
+        metadata_results = await asyncio.gather(
+            *(asyncio.to_thread(self._read_plugin_metadata, local_path, cache_dir) for local_path in local_plugin_dirs),
+            return_exceptions=True)
+
+        for local_path, meta in zip(local_plugin_dirs, metadata_results):
+            if isinstance(meta, (PluginLoadError, ConfigError)):
+                logger.error(f"Metadata error at {local_path}: {meta}")
+                continue
+            if isinstance(meta, BaseException):
+                raise meta
+            if meta:
+                plugin_name = meta['name']
+                if plugin_name not in plugin_metadata_map:
+                    plugin_metadata_map[plugin_name] = meta
+                    plugin_load_queue.append((plugin_name, local_path, meta))
+                else:
+                    logger.warning(f"Duplicate plugin '{plugin_name}' found at {local_path}.")
+
         # TODO: Load from Git
 
         # TODO: Topological sort
-        logger.debug(f"Load order: {[name for name, _, _ in plugin_load_queue]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Load order: {[name for name, _, _ in plugin_load_queue]}")
         sorted_load_order = plugin_load_queue
 
         for plugin_name, plugin_path, plugin_meta in sorted_load_order:
@@ -86,13 +105,16 @@ class PluginManager:
 
         logger.info(f"Profile loading finished. Plugins loaded: {len(self._plugins)}")
 
-    def _read_plugin_metadata(self, plugin_dir: Path) -> Optional[Dict]:
-        """Reads and validates metadata from plugin.toml, including new fields."""
+    def _read_plugin_metadata(self, plugin_dir: Path, cache_dir: Optional[Path] = None) -> Optional[Dict]:
+        """
+        Reads and validates metadata from plugin.toml, including new fields.
+        `cache_dir` enables the parsed-TOML cache of load_toml.
+        """
         plugin_toml_path = plugin_dir / "plugin.toml"
-        if not plugin_toml_path.is_file():
-            raise PluginLoadError(f"'plugin.toml' not found in: {plugin_dir}")
-
-        plugin_data = load_toml(plugin_toml_path)
+        try:
+            plugin_data = load_toml(plugin_toml_path, cache_dir=cache_dir)
+        except FileNotFoundError:
+            raise PluginLoadError(f"'plugin.toml' not found in: {plugin_dir}") from None
         plugin_meta = plugin_data.get("metadata", {})
         plugin_name = plugin_meta.get("name")
         entry_point_str = plugin_meta.get("entry_point")
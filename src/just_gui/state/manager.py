@@ -1,12 +1,19 @@
 # src/just_gui/state/manager.py
+import asyncio
 import logging
 import threading
-from typing import Any, Callable, Dict, List, Optional, Tuple
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 from collections import defaultdict
 import fnmatch
 
+from PySide6.QtCore import QCoreApplication, QObject, Qt, Signal, Slot
+
 from .history import HistoryManager, Command
 
+if TYPE_CHECKING:
+    from ..events.bus import EventBus
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,10 +28,121 @@ class StateChangeCommand(Command):
         self.old_value = old_value
 
     def execute(self):
-        self.state_manager._set_value(self.key, self.new_value, record_history=False)
+        self.state_manager._restore_value(self.key, self.new_value)
 
     def undo(self):
-        self.state_manager._set_value(self.key, self.old_value, record_history=False)
+        self.state_manager._restore_value(self.key, self.old_value)
+
+
+def _resolve_handler(handler: Any) -> Optional[Callable[[Any], None]]:
+    """Returns the callable behind a handler entry, or None if a weakly referenced handler has died."""
+    if isinstance(handler, weakref.ref):
+        return handler()
+    return handler
+
+
+def _handler_name(handler: Any) -> str:
+    target = _resolve_handler(handler)
+    if target is None:
+        return repr(handler)
+    return getattr(target, '__name__', repr(target))
+
+
+def _is_same_handler(entry: Any, handler: Any) -> bool:
+    """Compares a stored entry with a handler; weak references are compared by their targets."""
+    if isinstance(entry, CoalescedCallback):
+        entry = entry.handler
+    if entry is handler:
+        return True
+    entry = _resolve_handler(entry)
+    return entry is not None and entry == _resolve_handler(handler)
+
+
+class _GuiThreadInvoker(QObject):
+    """Runs callables posted from any thread on the next event loop iteration of the thread it lives in."""
+    _posted = Signal(object)
+
+    def __init__(self):
+        super().__init__()
+        # Always queued: a post from the GUI thread itself must be deferred too
+        self._posted.connect(self._run, Qt.ConnectionType.QueuedConnection)
+
+    def post(self, func: Callable[[], None]):
+        self._posted.emit(func)
+
+    @Slot(object)
+    def _run(self, func: Callable[[], None]):
+        func()
+
+
+_gui_invoker: Optional[_GuiThreadInvoker] = None
+_gui_invoker_lock = threading.Lock()
+
+
+def _get_gui_invoker() -> _GuiThreadInvoker:
+    """Returns the invoker living in the QCoreApplication (GUI) thread, creating it on first use."""
+    global _gui_invoker
+    with _gui_invoker_lock:
+        if _gui_invoker is None:
+            invoker = _GuiThreadInvoker()
+            app = QCoreApplication.instance()
+            if app is not None and invoker.thread() is not app.thread():
+                invoker.moveToThread(app.thread())
+            _gui_invoker = invoker
+        return _gui_invoker
+
+
+class CoalescedCallback:
+    """
+    Wraps a state handler so that a burst of notifications results in a single call
+    with the latest value on the next iteration of the GUI thread's event loop,
+    whichever thread the notifications come from.
+    """
+    __slots__ = ("handler", "_pending_value", "_scheduled", "_cancelled", "_lock")
+
+    def __init__(self, handler: Callable[[Any], None]):
+        self.handler = handler
+        self._pending_value: Any = None
+        self._scheduled = False
+        self._cancelled = False
+        self._lock = threading.Lock()
+
+    @property
+    def __name__(self) -> str:
+        return _handler_name(self.handler)
+
+    @property
+    def is_alive(self) -> bool:
+        """False if the wrapped handler is a weak reference whose target has died."""
+        return _resolve_handler(self.handler) is not None
+
+    def __call__(self, value: Any):
+        with self._lock:
+            self._pending_value = value
+            if self._scheduled:
+                return
+            self._scheduled = True
+        _get_gui_invoker().post(self._flush)
+
+    def cancel(self):
+        """Drops a pending notification (used on unsubscribe)."""
+        with self._lock:
+            self._cancelled = True
+            self._pending_value = None
+
+    def _flush(self):
+        with self._lock:
+            self._scheduled = False
+            if self._cancelled:
+                return
+            value, self._pending_value = self._pending_value, None
+        handler = _resolve_handler(self.handler)
+        if handler is None:
+            return
+        try:
+            handler(value)
+        except Exception as e:
+            logger.error("Error executing coalesced state subscriber %s: %s", self.__name__, e, exc_info=True)
 
 
 class StateManager:
@@ -33,12 +151,13 @@ class StateManager:
     Simple Lock is used for now, without complex thread safety (RW Lock).
     """
 
-    def __init__(self, history_manager: Optional[HistoryManager] = None):
+    def __init__(self, history_manager: Optional[HistoryManager] = None, event_bus: Optional['EventBus'] = None):
         self._state: Dict[str, Any] = {}
         self._subscribers: Dict[str, List[Callable[[Any], None]]] = defaultdict(list)
         self._wildcard_subscribers: Dict[str, List[Callable[[Any], None]]] = defaultdict(list)
         self._lock = threading.Lock()
         self._history_manager = history_manager or HistoryManager()
+        self._event_bus = event_bus
 
     @property
     def history(self) -> HistoryManager:
@@ -88,7 +207,7 @@ class StateManager:
             except KeyError:
                 return default
             except Exception as e:
-                logger.error(f"Error getting key '{key}': {e}", exc_info=True)
+                logger.error("Error getting key '%s': %s", key, e, exc_info=True)
                 return default
 
     def set(self, key: str, value: Any, description: Optional[str] = None):
@@ -97,15 +216,52 @@ class StateManager:
         Records change in history and notifies subscribers.
         """
         with self._lock:
-            self._set_value(key, value, record_history=True, description=description)
+            changed = self._set_value(key, value, record_history=True, description=description)
+        if changed:
+            self._notify_subscribers(key, value)
+
+    def apply(self, key: str, value: Any, *, description: Optional[str] = None,
+              publish_topic: Optional[str] = None, publish_payload: Any = None):
+        """
+        Sets a value as a single undoable step (labelled with `description`) and, if
+        `publish_topic` is given, posts `publish_payload` on the event bus
+        (see EventBus.post: bursts on the same topic are coalesced). Without a running event loop
+        (worker thread, script, test) the event is published with EventBus.publish_nowait instead.
+        Replaces the usual `with history.group(...): set(...); publish(...)` sequence.
+        """
+        publish = None
+        if publish_topic is not None and self._event_bus is not None:
+            # Chosen before set(), so the value is never changed without its event being deliverable
+            try:
+                asyncio.get_running_loop()
+                publish = self._event_bus.post
+            except RuntimeError:
+                publish = self._event_bus.publish_nowait
+        self.set(key, value, description=description)
+        if publish_topic is not None:
+            if publish is None:
+                logger.error("Cannot publish '%s' for key '%s': StateManager has no event bus", publish_topic, key)
+                return
+            publish(publish_topic, publish_payload)
+
+    def _restore_value(self, key: str, value: Any):
+        """Sets a value without recording history (used by undo/redo) and notifies subscribers."""
+        with self._lock:
+            changed = self._set_value(key, value, record_history=False)
+        if changed:
+            self._notify_subscribers(key, value)
 
-    def _set_value(self, key: str, value: Any, record_history: bool, description: Optional[str] = None):
-        """Internal method for setting value."""
+    def _set_value(self, key: str, value: Any, record_history: bool, description: Optional[str] = None) -> bool:
+        """
+        Internal method for setting value. Must be called with the lock held.
+        Returns True if the value has changed; subscribers are notified by the caller
+        after the lock is released.
+        """
         old_value = None
         try:
             if '.' not in key:
                 old_value = self._state.get(key)
-                if old_value == value: return
+                if old_value == value: return False
                 self._state[key] = value
             else:
                 key_parts = key.split('.')
@@ -114,76 +270,132 @@ class StateManager:
                 except KeyError:
                     old_value = None
 
-                if old_value == value: return
+                if old_value == value: return False
 
                 self._state, _ = self._set_value_by_key(self._state, key_parts, value)
 
-            logger.debug(f"State changed: '{key}' set to '{value}' (was '{old_value}')")
+            logger.debug("State changed: '%s' set to '%s' (was '%s')", key, value, old_value)
 
             if record_history and self._history_manager:
                 cmd = StateChangeCommand(self, key, value, old_value, description)
                 self._history_manager.add_command(cmd)
 
-            self._notify_subscribers(key, value)
+            return True
 
         except Exception as e:
-            logger.error(f"Error setting key '{key}': {e}", exc_info=True)
+            logger.error("Error setting key '%s': %s", key, e, exc_info=True)
+            return False
 
-    def subscribe(self, key_pattern: str, handler: Callable[[Any], None]):
+    def subscribe(self, key_pattern: str, handler: Callable[[Any], None], initial: bool = False,
+                  coalesce: bool = False):
         """
         Subscribes a handler to value changes by key or pattern (with '*').
+        The handler may also be a `weakref.WeakMethod` (or `weakref.ref`): it is then called
+        while its target is alive and dropped automatically once it has been garbage collected,
+        so no explicit unsubscribe is needed.
+        If `initial` is True, the handler is also called once with the current value
+        (exact keys only), so callers do not need a separate get() + call.
+        If `coalesce` is True, changes are delivered on the GUI thread on its next event loop
+        iteration, also when set() is called from another thread, and a burst of changes results
+        in a single call with the latest value (requires a running Qt event loop).
+        Handlers are called without the internal lock held, so they may freely read or set
+        state and (un)subscribe; a subscription change made during a notification takes
+        effect from the next change on.
         """
+        entry = CoalescedCallback(handler) if coalesce else handler
         with self._lock:
             if '*' in key_pattern:
-                self._wildcard_subscribers[key_pattern].append(handler)
-                logger.debug(f"Wildcard handler {handler.__name__} subscribed to pattern '{key_pattern}'")
+                self._wildcard_subscribers[key_pattern].append(entry)
+                logger.debug("Wildcard handler %s subscribed to pattern '%s'", _handler_name(handler), key_pattern)
             else:
-                self._subscribers[key_pattern].append(handler)
-                logger.debug(f"Handler {handler.__name__} subscribed to key '{key_pattern}'")
+                self._subscribers[key_pattern].append(entry)
+                logger.debug("Handler %s subscribed to key '%s'", _handler_name(handler), key_pattern)
+
+        if initial and '*' not in key_pattern:
+            target = _resolve_handler(handler)
+            if target is None:
+                return
+            try:
+                target(self.get(key_pattern))
+            except Exception as e:
+                logger.error("Error executing state subscriber %s for key '%s': %s",
+                             _handler_name(handler), key_pattern, e, exc_info=True)
 
     def unsubscribe(self, key_pattern: str, handler: Callable[[Any], None]):
-        """Unsubscribes a handler from a key or pattern."""
+        """Unsubscribes a handler (or a weak reference to it) from a key or pattern."""
         with self._lock:
             removed = False
-            if '*' in key_pattern:
-                if key_pattern in self._wildcard_subscribers:
-                    try:
-                        self._wildcard_subscribers[key_pattern].remove(handler)
-                        if not self._wildcard_subscribers[key_pattern]:
-                            del self._wildcard_subscribers[key_pattern]
-                        removed = True
-                    except ValueError:
-                        pass
-            else:
-                if key_pattern in self._subscribers:
-                    try:
-                        self._subscribers[key_pattern].remove(handler)
-                        if not self._subscribers[key_pattern]:
-                            del self._subscribers[key_pattern]
-                        removed = True
-                    except ValueError:
-                        pass
+            subscribers = self._wildcard_subscribers if '*' in key_pattern else self._subscribers
+            if key_pattern in subscribers:
+                handlers = subscribers[key_pattern]
+                for i, entry in enumerate(handlers):
+                    if not _is_same_handler(entry, handler):
+                        continue
+                    if isinstance(entry, CoalescedCallback):
+                        entry.cancel()
+                    del handlers[i]
+                    if not handlers:
+                        del subscribers[key_pattern]
+                    removed = True
+                    break
 
             if removed:
-                logger.debug(f"Handler {handler.__name__} unsubscribed from '{key_pattern}'")
+                logger.debug("Handler %s unsubscribed from '%s'", _handler_name(handler), key_pattern)
             else:
-                logger.warning(f"Handler {handler.__name__} not found for '{key_pattern}' during unsubscribe")
+                logger.warning("Handler %s not found for '%s' during unsubscribe", _handler_name(handler), key_pattern)
+
+    def _prune_dead_handlers(self, subscribers: Dict[str, List[Any]], key_pattern: str):
+        """Removes entries whose weakly referenced handlers have been garbage collected."""
+        handlers = subscribers.get(key_pattern)
+        if not handlers:
+            return
+        alive = [entry for entry in handlers if self._is_entry_alive(entry)]
+        if len(alive) == len(handlers):
+            return
+        logger.debug("Dropping %s dead subscriber(s) of '%s'", len(handlers) - len(alive), key_pattern)
+        if alive:
+            subscribers[key_pattern] = alive
+        else:
+            del subscribers[key_pattern]
+
+    @staticmethod
+    def _is_entry_alive(entry: Any) -> bool:
+        if isinstance(entry, CoalescedCallback):
+            return entry.is_alive
+        return _resolve_handler(entry) is not None
 
     def _notify_subscribers(self, changed_key: str, new_value: Any):
-        """Notifies all relevant subscribers about the change."""
+        """
+        Notifies all relevant subscribers about the change.
+        The matching handlers are snapshotted under the lock and called after releasing it.
+        """
         handlers_to_call: List[Callable[[Any], None]] = []
+        matched_lists: List[Tuple[Dict[str, List[Any]], str]] = []
 
-        if changed_key in self._subscribers:
-            handlers_to_call.extend(self._subscribers[changed_key])
+        with self._lock:
+            if changed_key in self._subscribers:
+                handlers_to_call.extend(self._subscribers[changed_key])
+                matched_lists.append((self._subscribers, changed_key))
 
-        for pattern, handlers in self._wildcard_subscribers.items():
-            if fnmatch.fnmatch(changed_key, pattern):
-                handlers_to_call.extend(handlers)
+            for pattern, handlers in self._wildcard_subscribers.items():
+                if fnmatch.fnmatch(changed_key, pattern):
+                    handlers_to_call.extend(handlers)
+                    matched_lists.append((self._wildcard_subscribers, pattern))
 
-        logger.debug(f"Notifying {len(handlers_to_call)} subscribers about change in '{changed_key}'")
-        for handler in handlers_to_call:
+        logger.debug("Notifying %s subscribers about change in '%s'", len(handlers_to_call), changed_key)
+        found_dead = False
+        for entry in handlers_to_call:
+            handler = _resolve_handler(entry)
+            if handler is None or (isinstance(entry, CoalescedCallback) and not entry.is_alive):
+                found_dead = True
+                continue
             try:
                 handler(new_value)
             except Exception as e:
-                logger.error(f"Error executing state subscriber {handler.__name__} for key '{changed_key}': {e}",
-                             exc_info=True)
+                logger.error("Error executing state subscriber %s for key '%s': %s",
+                             _handler_name(entry), changed_key, e, exc_info=True)
+
+        if found_dead:
+            with self._lock:
+                for subscribers, key_pattern in matched_lists:
+                    self._prune_dead_handlers(subscribers, key_pattern)
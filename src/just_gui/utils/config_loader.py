@@ -1,7 +1,16 @@
 # src/just_gui/utils/config_loader.py
-import toml
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+_READ_BUFFER_SIZE = 64 * 1024
+
+logger = logging.getLogger(__name__)
 
 
 class ConfigError(Exception):
@@ -9,12 +18,14 @@ class ConfigError(Exception):
     pass
 
 
-def load_toml(file_path: Path) -> Dict[str, Any]:
+def load_toml(file_path: Path, cache_dir: Optional[Path] = None) -> Dict[str, Any]:
     """
     Loads and parses a TOML file.
 
     Args:
         file_path: Path to the TOML file.
+        cache_dir: Optional directory for the parsed-data cache. If given, the parsed dictionary
+                   is pickled there and reused while the file's modification time and size are unchanged.
 
     Returns:
         Dictionary with data from the file.
@@ -24,13 +35,92 @@ def load_toml(file_path: Path) -> Dict[str, Any]:
         ConfigError: If a TOML parsing error occurred.
         Exception: Other possible file reading errors.
     """
-    if not file_path.is_file():
-        raise FileNotFoundError(f"Configuration file not found: {file_path}")
+    # EAFP: the open()/stat() below already fail for a missing file, no separate is_file() stat needed
+    try:
+        if cache_dir is None:
+            return _parse_toml_file(file_path)
+        return _load_cached_toml(file_path, cache_dir)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Configuration file not found: {file_path}") from e
+
+
+@lru_cache(maxsize=None)
+def _toml_parser() -> Tuple[Callable[[str], Dict[str, Any]], Tuple[Type[Exception], ...]]:
+    """
+    Returns (loads, decode_errors) of the TOML parser to use.
+    Imported on first parse only, so a start served entirely from the parse cache never loads a parser.
+    """
+    try:  # Optional native (Rust) parser, installed with the "speedups" extra
+        import rtoml
+        return rtoml.loads, (rtoml.TomlParsingError,)
+    except ImportError:
+        pass
+    try:  # Standard library since Python 3.11
+        import tomllib
+    except ImportError:
+        import tomli as tomllib
+    return tomllib.loads, (tomllib.TOMLDecodeError,)
+
 
+def _parse_toml_file(file_path: Path) -> Dict[str, Any]:
+    """Reads and parses a TOML file without any caching."""
+    loads, decode_errors = _toml_parser()
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return toml.load(f)
-    except toml.TomlDecodeError as e:
+        # One large read instead of many default-sized ones; the parsers take the whole document as str
+        with open(file_path, 'rb', buffering=_READ_BUFFER_SIZE) as f:
+            text = f.read().decode('utf-8')
+        return loads(text)
+    except decode_errors as e:
         raise ConfigError(f"Error parsing TOML file {file_path}: {e}") from e
+    except UnicodeDecodeError as e:
+        raise ConfigError(f"Error decoding TOML file {file_path} as UTF-8: {e}") from e
+    except FileNotFoundError:
+        raise
     except IOError as e:
         raise ConfigError(f"Error reading file {file_path}: {e}") from e
+
+
+def _cache_file_for(file_path: Path, cache_dir: Path) -> Path:
+    """Returns the cache file for a TOML file; one cache entry per absolute source path."""
+    digest = hashlib.sha1(str(file_path.resolve()).encode('utf-8')).hexdigest()
+    return cache_dir / f"{digest}.pkl"
+
+
+def _load_cached_toml(file_path: Path, cache_dir: Path) -> Dict[str, Any]:
+    """
+    Returns the parsed TOML file from the pickle cache if its (mtime_ns, size) key still matches,
+    otherwise parses the file and refreshes the cache. Cache failures never break loading.
+    """
+    stat = file_path.stat()
+    key: Tuple[int, int] = (stat.st_mtime_ns, stat.st_size)
+    cache_file = _cache_file_for(file_path, cache_dir)
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_key, cached_data = pickle.load(f)
+        if cached_key == key:
+            logger.debug("Using cached parse of %s", file_path)
+            return cached_data
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug("Ignoring unreadable TOML cache %s: %s", cache_file, e)
+
+    data = _parse_toml_file(file_path)
+    _write_cache(cache_file, key, data)
+    return data
+
+
+def _write_cache(cache_file: Path, key: Tuple[int, int], data: Dict[str, Any]):
+    """Writes a cache entry atomically (temporary file + os.replace), so readers never see a partial file."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        logger.debug("Could not write TOML cache %s: %s", cache_file, e)
@@ -0,0 +1,57 @@
+import os
+
+import pytest
+
+from just_gui.utils import config_loader
+from just_gui.utils.config_loader import load_toml
+
+
+@pytest.fixture
+def profile(tmp_path):
+    path = tmp_path / "profile.toml"
+    path.write_text('title = "first"\n', encoding='utf-8')
+    return path
+
+
+def _fail_parse(file_path):
+    raise AssertionError(f"{file_path} was parsed instead of read from the cache")
+
+
+def test_cache_hit_skips_parsing(profile, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    assert load_toml(profile, cache_dir=cache_dir) == {"title": "first"}
+
+    monkeypatch.setattr(config_loader, "_parse_toml_file", _fail_parse)
+    assert load_toml(profile, cache_dir=cache_dir) == {"title": "first"}
+
+
+def test_cache_invalidated_by_size_change(profile, tmp_path):
+    cache_dir = tmp_path / "cache"
+    load_toml(profile, cache_dir=cache_dir)
+
+    profile.write_text('title = "second, longer"\n', encoding='utf-8')
+
+    assert load_toml(profile, cache_dir=cache_dir) == {"title": "second, longer"}
+
+
+def test_cache_invalidated_by_mtime_change(profile, tmp_path):
+    cache_dir = tmp_path / "cache"
+    load_toml(profile, cache_dir=cache_dir)
+    old_mtime_ns = profile.stat().st_mtime_ns
+
+    profile.write_text('title = "other"\n', encoding='utf-8')  # same size as before
+    os.utime(profile, ns=(old_mtime_ns + 1_000_000_000, old_mtime_ns + 1_000_000_000))
+
+    assert load_toml(profile, cache_dir=cache_dir) == {"title": "other"}
+
+
+def test_corrupt_cache_file_is_ignored(profile, tmp_path):
+    cache_dir = tmp_path / "cache"
+    load_toml(profile, cache_dir=cache_dir)
+    cache_file = config_loader._cache_file_for(profile, cache_dir)
+    cache_file.write_bytes(b"not a pickle")
+
+    assert load_toml(profile, cache_dir=cache_dir) == {"title": "first"}
+    # The unreadable entry has been replaced by a valid one
+    assert load_toml(profile, cache_dir=cache_dir) == {"title": "first"}
+    assert cache_file.read_bytes() != b"not a pickle"
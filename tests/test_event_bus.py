@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from just_gui.events.bus import EventBus
+
+
+async def _drain(bus: EventBus):
+    """Waits until the dispatcher has started every queued async handler and all of them have finished."""
+    if bus._dispatch_queue is not None:
+        await bus._dispatch_queue.join()
+    await asyncio.gather(*bus._handler_tasks)
+
+
+def test_publish_nowait_without_running_loop_does_not_start_dispatcher():
+    bus = EventBus()
+    received = []
+
+    async def handler(data):
+        received.append(data)
+
+    bus.subscribe("counter.changed", handler)
+    bus.publish_nowait("counter.changed", 1)  # no running loop: the async handler is skipped
+    assert bus._dispatcher_task is None
+
+    async def main():
+        bus.publish_nowait("counter.changed", 2)
+        await _drain(bus)
+
+    asyncio.run(main())
+    assert received == [2]
+
+
+def test_dispatcher_is_recreated_for_a_new_loop():
+    bus = EventBus()
+    received = []
+
+    async def handler(data):
+        received.append(data)
+
+    bus.subscribe("counter.*", handler)
+
+    async def publish(value):
+        bus.publish_nowait("counter.changed", value)
+        await _drain(bus)
+        return bus._dispatcher_task
+
+    # The first loop is left open and idle, like a loop that was used before the application loop started
+    first_loop = asyncio.new_event_loop()
+    try:
+        first_task = first_loop.run_until_complete(publish(1))
+        second_task = asyncio.run(publish(2))
+        assert second_task is not first_task
+        assert received == [1, 2]
+    finally:
+        first_task.cancel()
+        first_loop.run_until_complete(asyncio.gather(first_task, return_exceptions=True))
+        first_loop.close()
+
+
+def test_post_requires_running_loop():
+    bus = EventBus()
+    bus.subscribe("counter.changed", lambda data: None)
+    with pytest.raises(RuntimeError):
+        bus.post("counter.changed", 1)
+    assert not bus._outbox
+
+
+def test_post_coalesces_to_latest_value():
+    bus = EventBus()
+    received = []
+    bus.subscribe("counter.changed", received.append)
+
+    async def main():
+        for value in (1, 2, 3):
+            bus.post("counter.changed", value)
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+    assert received == [3]
+
+
+def test_slow_async_handler_does_not_block_other_topics():
+    bus = EventBus()
+    finished = []
+
+    async def slow(data):
+        await asyncio.sleep(0.3)
+        finished.append("a")
+
+    async def fast(data):
+        finished.append("b")
+
+    bus.subscribe("a", slow)
+    bus.subscribe("b", fast)
+
+    async def main():
+        bus.publish_nowait("a", None)
+        bus.publish_nowait("b", None)
+        await asyncio.sleep(0.05)
+        assert finished == ["b"]
+        await _drain(bus)
+
+    asyncio.run(main())
+    assert finished == ["b", "a"]
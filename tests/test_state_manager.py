@@ -0,0 +1,63 @@
+import gc
+import weakref
+
+from just_gui.state.manager import StateManager
+
+
+class _Sink:
+    def __init__(self):
+        self.values = []
+
+    def on_change(self, value):
+        self.values.append(value)
+
+
+def test_dead_weak_method_is_pruned():
+    state = StateManager()
+    sink = _Sink()
+    state.subscribe("counter.value", weakref.WeakMethod(sink.on_change))
+
+    del sink
+    gc.collect()
+    state.set("counter.value", 1)
+
+    assert "counter.value" not in state._subscribers
+
+
+def test_unsubscribe_with_weak_method():
+    state = StateManager()
+    sink = _Sink()
+    state.subscribe("counter.value", weakref.WeakMethod(sink.on_change))
+
+    # A new WeakMethod to the same bound method identifies the subscription
+    state.unsubscribe("counter.value", weakref.WeakMethod(sink.on_change))
+    state.set("counter.value", 1)
+
+    assert sink.values == []
+    assert "counter.value" not in state._subscribers
+
+
+def test_subscribe_initial_delivers_current_value():
+    state = StateManager()
+    state.set("counter.value", 5)
+    sink = _Sink()
+
+    state.subscribe("counter.value", sink.on_change, initial=True)
+
+    assert sink.values == [5]
+
+
+def test_handler_can_set_state_reentrantly():
+    state = StateManager()
+    doubled = _Sink()
+
+    def double(value):
+        state.set("counter.doubled", value * 2)
+
+    state.subscribe("counter.value", double)
+    state.subscribe("counter.doubled", doubled.on_change)
+
+    state.set("counter.value", 3)
+
+    assert state.get("counter.doubled") == 6
+    assert doubled.values == [6]